@@ -0,0 +1,240 @@
+# alert_cluster.py
+
+"""
+Alert Cluster: Track active alerts across worker processes, with live counters in shared memory.
+
+AlertCluster starts one worker process per partition. Each worker owns the active alerts of the
+sensors that hash to it, kept in a Topic 5 DoublyLinkedList plus an alert ID -> node map so that
+resolving an alert unlinks it directly. The coordinator batches operations to the workers through
+queues and never waits for them.
+
+Every worker keeps one row of int64 counters in a multiprocessing.shared_memory block: operations
+processed, active alerts, active alerts per priority, and active alerts per type. Only the owning
+worker writes a row, so no locks are needed; the coordinator answers global queries such as
+"count of priority-1 alerts" by summing one column across the rows, without asking the workers.
+Each counter is exact on its own, but counters read together may reflect slightly different moments
+while batches are in flight; call wait_idle() first for a consistent reading.
+"""
+
+import multiprocessing
+import os
+import random
+import time
+import zlib
+from multiprocessing import shared_memory
+
+from topic5 import ALERT_TYPES, Alert, DoublyLinkedList
+
+PRIORITIES = (1, 2, 3, 4, 5)
+
+# Column layout of each worker's counter row
+PROCESSED = 0
+ACTIVE = 1
+PRIORITY_COLUMN = {priority: 2 + i for i, priority in enumerate(PRIORITIES)}
+TYPE_COLUMN = {alert_type: 2 + len(PRIORITIES) + i for i, alert_type in enumerate(ALERT_TYPES)}
+COLUMNS = 2 + len(PRIORITIES) + len(ALERT_TYPES)
+
+
+def partition_for(sensor_id, partitions):
+    return zlib.crc32(str(sensor_id).encode('utf-8')) % partitions
+
+
+def worker_main(index, shm_name, inbox):
+    """Apply batches of ('add', ...), ('remove', alert_id), and ('clear',) operations until None arrives."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    counters = shm.buf.cast('q')
+    base = index * COLUMNS
+    active_alerts = DoublyLinkedList(verbose=False)
+    nodes = {}  # Alert ID -> node
+
+    try:
+        while True:
+            batch = inbox.get()
+            if batch is None:
+                break
+            for op in batch:
+                if op[0] == 'add':
+                    _, alert_id, sensor_id, alert_type, priority, message = op
+                    active_alerts.add_alert(Alert(alert_id, sensor_id, alert_type, priority, message))
+                    nodes[alert_id] = active_alerts.tail
+                    counters[base + ACTIVE] += 1
+                    counters[base + PRIORITY_COLUMN[priority]] += 1
+                    counters[base + TYPE_COLUMN[alert_type]] += 1
+                elif op[0] == 'remove':
+                    node = nodes.pop(op[1], None)
+                    if node is not None:
+                        active_alerts.unlink(node)
+                        counters[base + ACTIVE] -= 1
+                        counters[base + PRIORITY_COLUMN[node.data.priority]] -= 1
+                        counters[base + TYPE_COLUMN[node.data.alert_type]] -= 1
+                elif op[0] == 'clear':
+                    active_alerts.clear_alerts()
+                    nodes.clear()
+                    for column in range(ACTIVE, COLUMNS):
+                        counters[base + column] = 0
+            counters[base + PROCESSED] += len(batch)
+    finally:
+        counters.release()
+        shm.close()
+
+
+class AlertCluster:
+    def __init__(self, workers=None, batch_size=1024):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.shm = shared_memory.SharedMemory(create=True, size=self.workers * COLUMNS * 8)
+        self.counters = self.shm.buf.cast('q')
+        for i in range(len(self.counters)):
+            self.counters[i] = 0
+        self.pending = [[] for _ in range(self.workers)]
+        self.submitted = [0] * self.workers  # Operations sent to each worker
+        self.locations = {}  # Alert ID -> worker, so resolving needs only the ID
+        self.inboxes = [multiprocessing.Queue() for _ in range(self.workers)]
+        self.processes = [multiprocessing.Process(target=worker_main, args=(i, self.shm.name, inbox), daemon=True)
+                          for i, inbox in enumerate(self.inboxes)]
+        for process in self.processes:
+            process.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _send(self, worker, op):
+        batch = self.pending[worker]
+        batch.append(op)
+        if len(batch) >= self.batch_size:
+            self._flush_worker(worker)
+
+    def _flush_worker(self, worker):
+        batch = self.pending[worker]
+        if batch:
+            self.inboxes[worker].put(batch)
+            self.submitted[worker] += len(batch)
+            self.pending[worker] = []
+
+    def flush(self):
+        for worker in range(self.workers):
+            self._flush_worker(worker)
+
+    def add_alert(self, alert_id, sensor_id, alert_type, priority, message):
+        if alert_id in self.locations:
+            raise ValueError(f"Alert ID '{alert_id}' already exists.")
+        if alert_type not in TYPE_COLUMN:
+            raise ValueError(f"Invalid alert type '{alert_type}'.")
+        if priority not in PRIORITY_COLUMN:
+            raise ValueError(f"Invalid priority '{priority}'.")
+        worker = partition_for(sensor_id, self.workers)
+        self.locations[alert_id] = worker
+        self._send(worker, ('add', alert_id, sensor_id, alert_type, priority, message))
+
+    def remove_alert(self, alert_id):
+        worker = self.locations.pop(alert_id, None)
+        if worker is None:
+            return False
+        self._send(worker, ('remove', alert_id))
+        return True
+
+    def clear_alerts(self):
+        self.locations.clear()
+        for worker in range(self.workers):
+            self._send(worker, ('clear',))
+        self.flush()
+
+    def wait_idle(self, timeout=30.0):
+        """Flush pending batches and wait until every worker has applied them."""
+        self.flush()
+        deadline = time.monotonic() + timeout
+        while any(self.counters[worker * COLUMNS + PROCESSED] < self.submitted[worker]
+                  for worker in range(self.workers)):
+            if time.monotonic() > deadline:
+                raise TimeoutError("Alert workers did not catch up in time.")
+            time.sleep(0.001)
+
+    # Global queries read the shared counters directly
+
+    def _column_total(self, column):
+        counters = self.counters
+        return sum(counters[worker * COLUMNS + column] for worker in range(self.workers))
+
+    def count_active(self):
+        return self._column_total(ACTIVE)
+
+    def count_priority(self, priority):
+        return self._column_total(PRIORITY_COLUMN[priority])
+
+    def count_type(self, alert_type):
+        return self._column_total(TYPE_COLUMN[alert_type])
+
+    def summary(self):
+        return {
+            'active': self.count_active(),
+            'priority': {priority: self.count_priority(priority) for priority in PRIORITIES},
+            'type': {alert_type: self.count_type(alert_type) for alert_type in ALERT_TYPES},
+        }
+
+    def close(self):
+        if self.shm is None:
+            return
+        self.flush()
+        for inbox in self.inboxes:
+            inbox.put(None)
+        for process in self.processes:
+            process.join()
+        self.counters.release()
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+
+def alert_storm(count, sensors=5000, seed=9):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (f"A{i}", f"S{rng.randrange(sensors)}", rng.choice(ALERT_TYPES),
+               rng.randint(1, 5), "Alert storm")
+
+
+def run_single_process(storm):
+    """Reference: one DoublyLinkedList with an ID -> node map, in this process."""
+    active_alerts = DoublyLinkedList(verbose=False)
+    nodes = {}
+    start = time.perf_counter()
+    for i, (alert_id, sensor_id, alert_type, priority, message) in enumerate(storm):
+        active_alerts.add_alert(Alert(alert_id, sensor_id, alert_type, priority, message))
+        nodes[alert_id] = active_alerts.tail
+        if i % 2:
+            active_alerts.unlink(nodes.pop(storm[i - 1][0]))
+    priority_1 = sum(1 for node in nodes.values() if node.data.priority == 1)
+    return time.perf_counter() - start, priority_1
+
+
+def run_cluster(storm, workers):
+    with AlertCluster(workers=workers) as cluster:
+        start = time.perf_counter()
+        for i, alert in enumerate(storm):
+            cluster.add_alert(*alert)
+            if i % 2:
+                cluster.remove_alert(storm[i - 1][0])
+        cluster.wait_idle()
+        elapsed = time.perf_counter() - start
+        query_start = time.perf_counter()
+        priority_1 = cluster.count_priority(1)
+        query_us = (time.perf_counter() - query_start) * 1e6
+    return elapsed, priority_1, query_us
+
+
+def main(alert_count=400_000):
+    storm = list(alert_storm(alert_count))
+    print(f"=== Alert Cluster ({alert_count:,} alerts, every other one resolved; {os.cpu_count()} CPUs) ===")
+    elapsed, priority_1 = run_single_process(storm)
+    print(f"Single process:  {alert_count / elapsed:>10,.0f} alerts/s  priority-1 active: {priority_1:,}")
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        elapsed, cluster_priority_1, query_us = run_cluster(storm, workers)
+        check = '' if cluster_priority_1 == priority_1 else ' [MISMATCH]'
+        print(f"{workers} worker(s):    {alert_count / elapsed:>10,.0f} alerts/s  priority-1 active: "
+              f"{cluster_priority_1:,} (query {query_us:.1f} us){check}")
+
+
+if __name__ == "__main__":
+    main()
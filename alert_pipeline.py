@@ -0,0 +1,165 @@
+# alert_pipeline.py
+
+"""
+Alert Pipeline: Stream raw sensor triggers through the event log, active alerts, and priority sorting.
+
+The stages are asyncio tasks connected by bounded queues, so a slow stage pushes back on the
+stages before it instead of letting memory grow:
+
+    sensor source -> event log (Topic 2 SinglyLinkedList) -> active alerts (Topic 5
+    DoublyLinkedList) -> priority ordering (Topic 7 quick_sort, in batches)
+
+Running this module feeds a synthetic high-rate sensor source through the pipeline and reports
+sustained events/sec and end-to-end latency percentiles.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime
+
+from topic2 import SinglyLinkedList
+from topic5 import ALERT_TYPES, Alert, DoublyLinkedList
+from topic7 import quick_sort
+
+END_OF_STREAM = None
+
+
+class SensorTrigger:
+    __slots__ = ('event_id', 'sensor_id', 'trigger_type', 'priority', 'created_at')
+
+    def __init__(self, event_id, sensor_id, trigger_type, priority):
+        self.event_id = event_id
+        self.sensor_id = sensor_id
+        self.trigger_type = trigger_type
+        self.priority = priority
+        self.created_at = time.perf_counter()  # Start of the end-to-end latency measurement
+
+
+class PipelineStats:
+    def __init__(self):
+        self.latencies = []  # Seconds from trigger creation to leaving the sort stage
+        self.sorted_batches = 0
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def report(self):
+        latencies = sorted(self.latencies)
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+
+        def percentile_ms(fraction):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        return {
+            'events': len(latencies),
+            'elapsed_s': elapsed,
+            'events_per_sec': len(latencies) / elapsed if elapsed > 0 else 0.0,
+            'sorted_batches': self.sorted_batches,
+            'latency_p50_ms': percentile_ms(0.50),
+            'latency_p95_ms': percentile_ms(0.95),
+            'latency_p99_ms': percentile_ms(0.99),
+            'latency_max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        }
+
+
+async def sensor_source(out_queue, events, sensors=1000, rate=None, seed=7):
+    """Emit synthetic triggers, as fast as the pipeline accepts them or at `rate` events/sec."""
+    rng = random.Random(seed)
+    burst = 100  # Triggers emitted between rate-limit checks
+    started_at = time.perf_counter()
+    for event_id in range(events):
+        trigger = SensorTrigger(event_id, f"S{rng.randrange(sensors)}",
+                                rng.choice(ALERT_TYPES), rng.randint(1, 5))
+        await out_queue.put(trigger)
+        if rate and event_id % burst == burst - 1:
+            delay = started_at + (event_id + 1) / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+    await out_queue.put(END_OF_STREAM)
+
+
+async def event_log_stage(in_queue, out_queue, event_log):
+    while True:
+        trigger = await in_queue.get()
+        if trigger is END_OF_STREAM:
+            await out_queue.put(END_OF_STREAM)
+            return
+        event_log.append(f"Sensor {trigger.sensor_id} triggered by {trigger.trigger_type} "
+                         f"at {datetime.now():%H:%M:%S}")
+        await out_queue.put(trigger)
+
+
+async def alert_tracking_stage(in_queue, out_queue, active_alerts, max_active):
+    active = 0
+    while True:
+        trigger = await in_queue.get()
+        if trigger is END_OF_STREAM:
+            await out_queue.put(END_OF_STREAM)
+            return
+        alert = Alert(f"A{trigger.event_id}", trigger.sensor_id, trigger.trigger_type,
+                      trigger.priority, f"{trigger.trigger_type} reported by {trigger.sensor_id}")
+        active_alerts.add_alert(alert)
+        active += 1
+        if active > max_active:
+            # Resolve the oldest alert; it is at the head, so remove_alert finds it immediately
+            active_alerts.remove_alert(active_alerts.head.data.alert_id)
+            active -= 1
+        await out_queue.put((alert, trigger.created_at))
+
+
+async def priority_sort_stage(in_queue, stats, batch_size, on_batch=None):
+    """Sort whatever has arrived (up to batch_size alerts) by priority with quick_sort."""
+    finished = False
+    while not finished:
+        batch = [await in_queue.get()]
+        while len(batch) < batch_size and not in_queue.empty():
+            batch.append(in_queue.get_nowait())
+        if batch[-1] is END_OF_STREAM:
+            batch.pop()
+            finished = True
+        if not batch:
+            continue
+        quick_sort(batch, 0, len(batch) - 1, key=lambda item: item[0].priority)
+        now = time.perf_counter()
+        stats.latencies.extend(now - created_at for _, created_at in batch)
+        stats.sorted_batches += 1
+        if on_batch:
+            on_batch([alert for alert, _ in batch])
+        await asyncio.sleep(0)  # Let upstream stages refill while this batch is consumed
+
+
+async def run_pipeline(events=100_000, rate=None, buffer_size=1024, batch_size=256,
+                       max_active=10_000, on_batch=None):
+    """Run every stage to completion and return (stats report, event log, active alerts)."""
+    event_log = SinglyLinkedList(verbose=False)
+    active_alerts = DoublyLinkedList(verbose=False)
+    triggers = asyncio.Queue(maxsize=buffer_size)
+    logged = asyncio.Queue(maxsize=buffer_size)
+    tracked = asyncio.Queue(maxsize=buffer_size)
+    stats = PipelineStats()
+    await asyncio.gather(
+        sensor_source(triggers, events, rate=rate),
+        event_log_stage(triggers, logged, event_log),
+        alert_tracking_stage(logged, tracked, active_alerts, max_active),
+        priority_sort_stage(tracked, stats, batch_size, on_batch),
+    )
+    stats.finished_at = time.perf_counter()
+    return stats.report(), event_log, active_alerts
+
+
+def main():
+    print("=== Streaming Alert Pipeline ===")
+    for label, rate in (("unthrottled", None), ("20,000 events/s", 20_000)):
+        report, _, _ = asyncio.run(run_pipeline(events=100_000, rate=rate))
+        print(f"\nSource rate: {label}")
+        print(f"  Events processed: {report['events']:,} in {report['elapsed_s']:.2f} s "
+              f"({report['events_per_sec']:,.0f} events/s, {report['sorted_batches']:,} sorted batches)")
+        print(f"  End-to-end latency: p50 {report['latency_p50_ms']:.2f} ms, "
+              f"p95 {report['latency_p95_ms']:.2f} ms, p99 {report['latency_p99_ms']:.2f} ms, "
+              f"max {report['latency_max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# anomaly_detector.py
+
+"""
+Anomaly Detector: Rolling-window temperature anomaly detection that raises Topic 5 alerts.
+
+RollingAnomalyDetector keeps the last `window` readings of every sensor in one NumPy ring buffer,
+shaped (sensors, window), together with a running sum and sum of squares per sensor. Each tick
+takes one reading per sensor as an array and evaluates every sensor in a single vectorized pass:
+a reading whose z-score against the sensor's rolling mean and standard deviation exceeds the
+threshold is anomalous. An alert is raised when a sensor becomes anomalous, not again on every
+tick while it stays anomalous. Alerts are Topic 5 Alert objects of type 'temperature_anomaly'.
+
+A missing reading can be passed as NaN. It is not checked and goes into the window as an empty
+(NaN) slot, so the window keeps advancing in step but the gap is left out of the sensor's sums
+instead of being filled with made-up samples. Each sensor keeps its own count of readings held
+and is checked once that count reaches min_samples, so a sensor coming back from an outage as long
+as the window is not checked again until it has min_samples fresh readings.
+
+Requires NumPy (listed in requirements.txt).
+"""
+
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from topic5 import Alert, DoublyLinkedList
+
+
+class RollingAnomalyDetector:
+    def __init__(self, sensor_ids, window=60, threshold=5.0, min_samples=20, min_std=0.05, priority=2):
+        self.sensor_ids = list(sensor_ids)
+        self.window = window
+        self.threshold = threshold
+        self.min_samples = min(min_samples, window)  # Readings needed before a sensor is checked
+        self.min_std = min_std  # Floor for the standard deviation, so a flat signal does not divide by ~0
+        self.priority = priority
+        if np is None:
+            raise ImportError("RollingAnomalyDetector requires NumPy: pip install -r requirements.txt")
+        count = len(self.sensor_ids)
+        self.buffer = np.full((count, window), np.nan)  # NaN marks an empty slot
+        self.sums = np.zeros(count)
+        self.squares = np.zeros(count)
+        self.counts = np.zeros(count, dtype=np.int64)  # Readings held per sensor, up to window
+        self.anomalous = np.zeros(count, dtype=bool)
+        self.position = 0  # Ring slot the next reading goes to
+        self.alert_count = 0
+
+    def update(self, readings, active_alerts=None):
+        """Check one tick of readings (one per sensor, in sensor_ids order). Returns the new alerts."""
+        readings = np.asarray(readings, dtype=float)
+        missing = np.isnan(readings)
+
+        alerts = []
+        checked = self.counts >= self.min_samples
+        if checked.any():
+            counts = np.maximum(self.counts, 1)
+            mean = self.sums / counts
+            std = np.sqrt(np.maximum(self.squares / counts - mean * mean, 0.0))
+            with np.errstate(invalid='ignore'):
+                z_scores = np.abs(readings - mean) / np.maximum(std, self.min_std)
+                flags = (z_scores > self.threshold) & checked & ~missing
+            raised = np.flatnonzero(flags & ~self.anomalous)
+            self.anomalous = flags
+            for index in raised:
+                alerts.append(self._alert(index, readings[index], mean[index], z_scores[index]))
+        else:
+            self.anomalous[:] = False
+
+        slot = self.position
+        present = ~missing
+        values = np.where(present, readings, 0.0)
+        old = self.buffer[:, slot]
+        old_present = ~np.isnan(old)
+        old_values = np.where(old_present, old, 0.0)
+        self.sums += values - old_values
+        self.squares += values * values - old_values * old_values
+        self.counts += present.astype(np.int64) - old_present
+        self.buffer[:, slot] = readings
+        self.position = (slot + 1) % self.window
+        if self.position == 0:
+            # Once per lap, recompute the sums exactly so rounding errors do not accumulate
+            held = np.nan_to_num(self.buffer)
+            self.sums = held.sum(axis=1)
+            self.squares = np.einsum('ij,ij->i', held, held)
+
+        if active_alerts is not None:
+            for alert in alerts:
+                active_alerts.add_alert(alert)
+        return alerts
+
+    def _alert(self, index, reading, mean, z_score):
+        self.alert_count += 1
+        sensor_id = self.sensor_ids[index]
+        message = f"Temperature {reading:.1f} deviates from rolling mean {mean:.1f} (z={z_score:.1f})"
+        return Alert(f"TA{self.alert_count}", sensor_id, 'temperature_anomaly', self.priority, message)
+
+    def update_batch(self, ticks, active_alerts=None):
+        """Process a (ticks, sensors) array of readings, one tick at a time."""
+        alerts = []
+        for readings in ticks:
+            alerts.extend(self.update(readings, active_alerts))
+        return alerts
+
+
+def synthetic_readings(sensor_count, ticks, anomaly_rate=1e-4, seed=8):
+    """Yield one array of temperatures per tick: a steady per-sensor baseline with noise and rare spikes."""
+    rng = np.random.default_rng(seed)
+    baseline = rng.uniform(18.0, 24.0, sensor_count)
+    for _ in range(ticks):
+        readings = baseline + rng.normal(0.0, 0.3, sensor_count)
+        spikes = rng.random(sensor_count) < anomaly_rate
+        readings[spikes] += rng.choice([-1.0, 1.0], spikes.sum()) * rng.uniform(5.0, 15.0, spikes.sum())
+        yield readings
+
+
+class LoopDetector:
+    """Reference: the same rule evaluated one reading at a time with per-sensor deques.
+
+    A missing (NaN) reading is stored as None, the loop equivalent of an empty slot.
+    """
+
+    def __init__(self, sensor_count, window=60, threshold=5.0, min_samples=20, min_std=0.05):
+        self.windows = [deque(maxlen=window) for _ in range(sensor_count)]
+        self.counts = [0] * sensor_count  # Readings held per sensor, not counting empty slots
+        self.sums = [0.0] * sensor_count
+        self.squares = [0.0] * sensor_count
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.min_std = min_std
+
+    def update(self, readings):
+        flagged = 0
+        for index, reading in enumerate(readings):
+            values = self.windows[index]
+            count = self.counts[index]
+            present = reading == reading  # False for NaN
+            if present and count >= self.min_samples:
+                mean = self.sums[index] / count
+                std = max(max(self.squares[index] / count - mean * mean, 0.0) ** 0.5, self.min_std)
+                if abs(reading - mean) / std > self.threshold:
+                    flagged += 1
+            if len(values) == values.maxlen and values[0] is not None:
+                old = values[0]
+                self.sums[index] -= old
+                self.squares[index] -= old * old
+                self.counts[index] -= 1
+            if not present:
+                values.append(None)
+                continue
+            values.append(reading)
+            self.sums[index] += reading
+            self.squares[index] += reading * reading
+            self.counts[index] += 1
+        return flagged
+
+
+def main(sensor_count=10_000, ticks=300):
+    if np is None:
+        print("anomaly_detector requires NumPy: pip install -r requirements.txt")
+        return
+    print(f"=== Rolling Anomaly Detection ({sensor_count:,} sensors x {ticks} ticks) ===")
+    ticks_data = list(synthetic_readings(sensor_count, ticks))
+    sensor_ids = [f"T{i}" for i in range(sensor_count)]
+
+    detector = RollingAnomalyDetector(sensor_ids)
+    active_alerts = DoublyLinkedList(verbose=False)
+    start = time.perf_counter()
+    alerts = detector.update_batch(ticks_data, active_alerts)
+    elapsed = time.perf_counter() - start
+    print(f"Vectorized: {elapsed / ticks * 1000:7.2f} ms per tick  "
+          f"({sensor_count * ticks / elapsed:,.0f} readings/s), {len(alerts)} alerts")
+
+    loop = LoopDetector(sensor_count)
+    check = RollingAnomalyDetector(sensor_ids)
+    loop_ticks = [readings.copy() for readings in ticks_data[:60]]
+    for readings in loop_ticks[20:50]:
+        readings[::100] = np.nan  # Outage on every 100th sensor, so the missing-reading path is compared too
+    start = time.perf_counter()
+    loop_flagged = sum(loop.update(readings.tolist()) for readings in loop_ticks)
+    loop_elapsed = time.perf_counter() - start
+    check_flagged = 0
+    for readings in loop_ticks:
+        check.update(readings)
+        check_flagged += int(check.anomalous.sum())
+    print(f"Per-reading loop: {loop_elapsed / len(loop_ticks) * 1000:7.2f} ms per tick  "
+          f"({sensor_count * len(loop_ticks) / loop_elapsed:,.0f} readings/s)"
+          f"{'' if loop_flagged == check_flagged else ' [MISMATCH]'}")
+
+    if alerts:
+        print("First alert:", alerts[0])
+
+
+if __name__ == "__main__":
+    main()
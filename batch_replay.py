@@ -0,0 +1,342 @@
+# batch_replay.py
+
+"""
+Batch Replay: Apply a recorded stream of operations to the system's data structures without the menus.
+
+Every topic's main() is driven by input() prompts. This module applies the same operations to
+the same structures (the test.py dictionaries, the Topic 2-7 lists, deque, and tree) straight
+from a file, at full speed, with console output optional and per-operation timing reported.
+
+Two input formats are accepted, one operation per line:
+
+    JSON lines:      {"op": "topic4.add_rear", "args": ["Lock all doors"]}
+    Command script:  topic4.add_rear "Lock all doors"      (shell-style quoting, '#' comments)
+
+Usage: python batch_replay.py FILE [--echo] [--deque-size N] [--tree-root NAME]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import re
+import shlex
+import sys
+import time
+
+import test
+import topic2
+import topic3
+import topic4
+import topic5
+import topic6
+import topic7
+
+class OperationTimer:
+    def __init__(self):
+        self.stats = {}  # Operation -> [count, total seconds, max seconds]
+
+    def record(self, op, elapsed):
+        entry = self.stats.get(op)
+        if entry is None:
+            self.stats[op] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+
+    def report(self):
+        rows = sorted(self.stats.items(), key=lambda item: item[1][1], reverse=True)
+        return [{'op': op, 'count': count, 'total_ms': total * 1000,
+                 'mean_us': total / count * 1e6, 'max_us': longest * 1e6}
+                for op, (count, total, longest) in rows]
+
+
+def checked_alert_fields(alert_type, priority):
+    """Lower-cased alert type and int priority, or ValueError where the topic menus reject them."""
+    alert_type = alert_type.lower()
+    if alert_type not in topic5.ALERT_TYPES:
+        raise ValueError("Invalid alert type. Please choose from 'intrusion', 'fire', or 'temperature_anomaly'.")
+    checked_priority = topic5.parse_priority(priority)
+    if checked_priority is None:
+        raise ValueError("Please enter a valid priority between 1 and 5.")
+    return alert_type, checked_priority
+
+
+class ReplaySession:
+    """One instance of every structure, plus a handler per operation named op_<topic>_<name>."""
+
+    def __init__(self, deque_size=10, tree_root="HomeSecuritySystem", verbose=False):
+        self.sensors = {}
+        self.alarms = {}
+        self.users = {}
+        self.event_logs = topic2.SinglyLinkedList(verbose=verbose)
+        self.active_sessions = topic2.DoublyLinkedList(verbose=verbose)
+        self.rotation_list = topic3.CircularLinkedList(verbose=verbose)
+        self.fixed_deque = topic4.FixedDeque(deque_size, verbose=verbose)
+        self.active_alerts = topic5.DoublyLinkedList(verbose=verbose)
+        self.alert_ids = set()
+        self.tree = topic6.Tree(tree_root, verbose=verbose)
+        self.sorted_alerts = []
+
+    def handler(self, op):
+        method = getattr(self, "op_" + op.replace(".", "_"), None)
+        if method is None:
+            raise ValueError(f"Unknown operation '{op}'.")
+        return method
+
+    # --- test.py (Topic 1) ---
+
+    def op_topic1_add_sensor(self, sensor_id, sensor_type, location):
+        if sensor_id in self.sensors:
+            print("Sensor ID already exists.")
+        else:
+            self.sensors[sensor_id] = test.Sensor(sensor_id, sensor_type, location)
+            print("Sensor added successfully.")
+
+    def op_topic1_activate_sensor(self, sensor_id):
+        sensor = self.sensors.get(sensor_id)
+        if sensor:
+            sensor.activate()
+        else:
+            print("Sensor not found.")
+
+    def op_topic1_deactivate_sensor(self, sensor_id):
+        sensor = self.sensors.get(sensor_id)
+        if sensor:
+            sensor.deactivate()
+        else:
+            print("Sensor not found.")
+
+    def op_topic1_add_alarm(self, alarm_id, alarm_type):
+        if alarm_id in self.alarms:
+            print("Alarm ID already exists.")
+        else:
+            self.alarms[alarm_id] = test.Alarm(alarm_id, alarm_type)
+            print("Alarm added successfully.")
+
+    def op_topic1_turn_on_alarm(self, alarm_id):
+        alarm = self.alarms.get(alarm_id)
+        if alarm:
+            alarm.turn_on()
+        else:
+            print("Alarm not found.")
+
+    def op_topic1_turn_off_alarm(self, alarm_id):
+        alarm = self.alarms.get(alarm_id)
+        if alarm:
+            alarm.turn_off()
+        else:
+            print("Alarm not found.")
+
+    def op_topic1_add_user(self, user_id, name, role):
+        if user_id in self.users:
+            print("User ID already exists.")
+        else:
+            self.users[user_id] = test.User(user_id, name, role)
+            print("User added successfully.")
+
+    def op_topic1_display_all(self):
+        test.display_all(self.sensors, self.alarms, self.users)
+
+    # --- Topic 2 ---
+
+    def op_topic2_add_event(self, event):
+        self.event_logs.append(event)
+
+    def op_topic2_display_events(self):
+        self.event_logs.display()
+
+    def op_topic2_add_session(self, session):
+        self.active_sessions.append(session)
+
+    def op_topic2_remove_session(self, session):
+        self.active_sessions.remove(session)
+
+    def op_topic2_display_sessions(self):
+        self.active_sessions.display()
+
+    # --- Topic 3 ---
+
+    def op_topic3_add_sensor(self, sensor_id):
+        self.rotation_list.append(sensor_id)
+
+    def op_topic3_remove_sensor(self, sensor_id):
+        self.rotation_list.remove(sensor_id)
+
+    def op_topic3_traverse(self, steps):
+        self.rotation_list.traverse(int(steps))
+
+    def op_topic3_display(self):
+        self.rotation_list.display()
+
+    # --- Topic 4 (a full deque evicts from the other end, as if the user confirmed 'yes') ---
+
+    def op_topic4_add_front(self, command):
+        if self.fixed_deque.is_full() and not self.fixed_deque.would_coalesce(command):
+            self.fixed_deque.remove_rear()
+        self.fixed_deque.add_front(command)
+
+    def op_topic4_add_rear(self, command):
+        if self.fixed_deque.is_full() and not self.fixed_deque.would_coalesce(command):
+            self.fixed_deque.remove_front()
+        self.fixed_deque.add_rear(command)
+
+    def op_topic4_remove_front(self):
+        self.fixed_deque.remove_front()
+
+    def op_topic4_remove_rear(self):
+        self.fixed_deque.remove_rear()
+
+    def op_topic4_search_command(self, command):
+        self.fixed_deque.search_command(command)
+
+    def op_topic4_clear(self):
+        self.fixed_deque.clear_deque()
+
+    def op_topic4_display(self):
+        self.fixed_deque.display()
+
+    # --- Topic 5 ---
+
+    def op_topic5_add_alert(self, alert_id, sensor_id, alert_type, priority, message):
+        # Normalized and checked as topic5's main() does; a rejected line is reported as an error
+        alert_id, sensor_id, message = alert_id.strip(), sensor_id.strip(), message.strip()
+        for field, value in (("Alert ID", alert_id), ("Sensor ID", sensor_id), ("Message", message)):
+            if not value:
+                raise ValueError(f"{field} cannot be empty.")
+        alert_type, priority = checked_alert_fields(alert_type, priority)
+        if alert_id in self.alert_ids:
+            print("[Error] Alert ID already exists. Please use a unique ID.")
+            return
+        alert = topic5.Alert(alert_id, sensor_id, alert_type, priority, message)
+        self.active_alerts.add_alert(alert)
+        self.alert_ids.add(alert_id)
+
+    def op_topic5_resolve_alert(self, alert_id):
+        if self.active_alerts.remove_alert(alert_id):
+            self.alert_ids.discard(alert_id)
+
+    def op_topic5_clear(self):
+        self.active_alerts.clear_alerts()
+        self.alert_ids.clear()
+
+    def op_topic5_display(self):
+        self.active_alerts.display_alerts()
+
+    # --- Topic 6 ---
+
+    def op_topic6_add_node(self, parent, child):
+        self.tree.add_node(parent, child)
+
+    def op_topic6_remove_node(self, parent, child):
+        self.tree.remove_node(parent, child)
+
+    def op_topic6_move_node(self, child, current_parent, new_parent):
+        self.tree.move_node(child, current_parent, new_parent)
+
+    def op_topic6_find_node(self, data):
+        self.tree.find_and_display_node(data)
+
+    def op_topic6_display(self):
+        self.tree.display_tree()
+
+    # --- Topic 7 ---
+
+    def op_topic7_add_alert(self, alert_id, sensor_id, alert_type, priority, timestamp, message):
+        alert_type, priority = checked_alert_fields(alert_type, priority)
+        self.sorted_alerts.append(topic7.Alert(alert_id, sensor_id, alert_type, priority, timestamp, message))
+
+    def op_topic7_sort(self):
+        if self.sorted_alerts:
+            topic7.quick_sort(self.sorted_alerts, 0, len(self.sorted_alerts) - 1, key=lambda x: x.priority)
+
+    def op_topic7_display(self):
+        for alert in self.sorted_alerts:
+            print(alert)
+
+
+TOKEN_PATTERN = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\S+)')
+
+
+def parse_line(line):
+    """Return (op, args) for one line of either format, or None for blank and comment lines."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if line.startswith('{'):
+        record = json.loads(line)
+        return record['op'], [str(arg) for arg in record.get('args', [])]
+    if '\\' in line or line.count('"') % 2 or line.count("'") % 2:
+        # Escapes need the full shell-style parser, and it rejects an unterminated quote
+        # instead of keeping it as a literal character the way the fast path would
+        parts = shlex.split(line)
+    else:
+        # shlex is slow; plain and simply quoted words cover recorded traffic
+        parts = [double or single or bare for double, single, bare in TOKEN_PATTERN.findall(line)]
+    return parts[0], parts[1:]
+
+
+def replay(lines, session, echo=False, stop_on_error=False):
+    """Apply every operation in lines to session. Returns (timer, errors, elapsed seconds).
+
+    With echo off, the session's structures should be created with verbose=False; what still
+    prints (display operations, test.py objects, the handlers' own messages) goes to os.devnull.
+    """
+    timer = OperationTimer()
+    errors = []
+    clock = time.perf_counter
+    started_at = clock()
+    with open(os.devnull, 'w') as null_output, contextlib.redirect_stdout(sys.stdout if echo else null_output):
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                parsed = parse_line(line)
+                if parsed is None:
+                    continue
+                op, args = parsed
+                handler = session.handler(op)
+                start = clock()
+                handler(*args)
+                timer.record(op, clock() - start)
+            except Exception as error:
+                # A bad line, including one that recurses too deep, is reported and the replay goes on
+                errors.append((line_number, str(error) or type(error).__name__))
+                if stop_on_error:
+                    break
+    return timer, errors, clock() - started_at
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a script of operations against the security system structures.")
+    parser.add_argument('script', help="JSON-lines or command script file ('-' for stdin)")
+    parser.add_argument('--echo', action='store_true', help="show the structures' console output")
+    parser.add_argument('--deque-size', type=int, default=10, help="maximum size of the Topic 4 deque")
+    parser.add_argument('--tree-root', default="HomeSecuritySystem", help="root of the Topic 6 tree")
+    parser.add_argument('--stop-on-error', action='store_true')
+    args = parser.parse_args(argv)
+
+    session = ReplaySession(deque_size=args.deque_size, tree_root=args.tree_root, verbose=args.echo)
+    if args.script == '-':
+        timer, errors, elapsed = replay(sys.stdin, session, args.echo, args.stop_on_error)
+    else:
+        with open(args.script, encoding='utf-8') as script:
+            timer, errors, elapsed = replay(script, session, args.echo, args.stop_on_error)
+
+    rows = timer.report()
+    total_ops = sum(row['count'] for row in rows)
+    print(f"\n=== Replay Summary: {total_ops:,} operations in {elapsed:.3f} s "
+          f"({total_ops / elapsed if elapsed > 0 else 0:,.0f} ops/s) ===")
+    print(f"{'Operation':<28} {'count':>9} {'total ms':>10} {'mean us':>9} {'max us':>9}")
+    for row in rows:
+        print(f"{row['op']:<28} {row['count']:>9,} {row['total_ms']:>10.2f} "
+              f"{row['mean_us']:>9.1f} {row['max_us']:>9.1f}")
+    for line_number, message in errors[:10]:
+        print(f"[Error] Line {line_number}: {message}")
+    if len(errors) > 10:
+        print(f"[Error] ... and {len(errors) - 10} more.")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
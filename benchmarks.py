@@ -0,0 +1,301 @@
+# benchmarks.py
+
+"""
+Benchmarks: Measure how every data structure in the project scales as the data grows.
+
+Each case times one core operation at sizes from 10^3 up to 10^6 (console output suppressed, best
+of three rounds over all sizes with the garbage collector paused), fits an empirical complexity
+curve time ~ n^k by least squares on a log-log scale, and records peak memory with tracemalloc.
+Every case declares the exponent the current code is expected to have; the run fails (exit
+status 1) when a fitted exponent exceeds that by more than the tolerance, so an accidental O(n^2)
+shows up here rather than in production.
+
+Operations that are quadratic today (e.g. appending to a list without a tail reference) are
+capped at smaller sizes and carry an expected exponent of 2, documenting the current behaviour.
+"""
+
+import argparse
+import contextlib
+import gc
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import topic2
+import topic3
+import topic4
+import topic5
+import topic6
+import topic7
+
+SIZES = [1_000, 3_000, 10_000, 30_000, 100_000, 300_000, 1_000_000]
+PROBES = 100  # Operations timed per size for the per-operation (search/remove) cases
+ROUNDS = 3  # Timed rounds over all sizes; the best time of each size is kept
+MIN_TIMED = 0.2  # Seconds per round: fast sizes keep repeating until their runs add up to this
+MAX_REPEATS = 25
+
+
+class Case:
+    def __init__(self, name, setup, run, expected_exponent, max_size=SIZES[-1], sizes=SIZES):
+        self.name = name
+        self.setup = setup  # setup(n) -> state, not timed
+        self.run = run  # run(state, n), timed
+        self.expected_exponent = expected_exponent
+        self.max_size = max_size
+        self.sizes = sizes  # Sizes timed, up to max_size
+
+
+# --- Helpers that build structures directly, so setup cost does not dominate ---
+
+def linked_nodes(node_class, values, doubly=False):
+    head = previous = None
+    for value in values:
+        node = node_class(value)
+        if previous is None:
+            head = node
+        else:
+            previous.next = node
+            if doubly:
+                node.prev = previous
+        previous = node
+    return head, previous
+
+
+def build_event_log(n):
+    event_log = topic2.SinglyLinkedList(verbose=False)
+    append_all(event_log, 'append', n)
+    return event_log
+
+
+def build_sessions(n):
+    sessions = topic2.DoublyLinkedList(verbose=False)
+    sessions.head, _ = linked_nodes(topic2.DoublyNode, (f"Session {i}" for i in range(n)), doubly=True)
+    return sessions
+
+
+def build_rotation(n):
+    rotation = topic3.CircularLinkedList(verbose=False)
+    rotation.head, last = linked_nodes(topic3.CircularNode, (f"S{i}" for i in range(n)))
+    last.next = rotation.head
+    return rotation
+
+
+def build_alerts(n):
+    return [topic5.Alert(f"A{i}", f"S{i % 1000}", 'intrusion', i % 5 + 1, "benchmark") for i in range(n)]
+
+
+def build_alert_list(n):
+    active_alerts = topic5.DoublyLinkedList(verbose=False)
+    for alert in build_alerts(n):
+        active_alerts.add_alert(alert)
+    return active_alerts
+
+
+def build_tree(n, fanout=10):
+    tree = topic6.Tree("Home", verbose=False)
+    nodes = [tree.root]
+    for i in range(1, n):
+        node = topic6.TreeNode(f"Device {i}", verbose=False)
+        nodes[(i - 1) // fanout].children.append(node)
+        nodes.append(node)
+    return tree
+
+
+def append_all(structure, method, n):
+    add = getattr(structure, method)
+    for i in range(n):
+        add(f"Item {i}")
+
+
+def add_all_alerts(state, n):
+    active_alerts, alerts = state
+    for alert in alerts:
+        active_alerts.add_alert(alert)
+
+
+def deque_churn(fixed_deque, n):
+    for i in range(n):
+        if fixed_deque.is_full():
+            fixed_deque.remove_front()
+        fixed_deque.add_rear(f"Check Sensor S{i}")
+
+
+def full_deque(n):
+    fixed_deque = topic4.FixedDeque(n, verbose=False)
+    for i in range(n):
+        fixed_deque.add_rear(f"Check Sensor S{i}")
+    return fixed_deque
+
+
+def random_keys(n, distinct):
+    rng = random.Random(n)
+    if distinct:
+        return [rng.random() for _ in range(n)]
+    return [rng.randint(1, 5) for _ in range(n)]
+
+
+def add_tree_devices(tree, n):
+    for i in range(1, n):
+        tree.add_node(f"Device {(i - 1) // 10}" if i > 10 else "Home", f"Device {i}")
+
+
+CASES = [
+    Case("SinglyLinkedList.append (event log)",
+         lambda n: topic2.SinglyLinkedList(verbose=False),
+         lambda log, n: append_all(log, 'append', n), 1.0),
+    Case("SinglyLinkedList.display",
+         build_event_log,
+         lambda log, n: log.display(), 1.0),
+    Case("DoublyLinkedList.append (sessions)",
+         lambda n: topic2.DoublyLinkedList(verbose=False),
+         lambda sessions, n: append_all(sessions, 'append', n), 2.0, max_size=10_000),
+    Case("DoublyLinkedList.remove (sessions, last item)",
+         build_sessions,
+         lambda sessions, n: [sessions.remove(f"Session {n - 1 - i}") for i in range(PROBES)], 1.0),
+    Case("CircularLinkedList.append",
+         lambda n: topic3.CircularLinkedList(verbose=False),
+         lambda rotation, n: append_all(rotation, 'append', n), 2.0, max_size=10_000),
+    Case("CircularLinkedList.traverse",
+         build_rotation,
+         lambda rotation, n: rotation.traverse(n), 1.0),
+    Case("DoublyLinkedList.add_alert (active alerts)",
+         lambda n: (topic5.DoublyLinkedList(verbose=False), build_alerts(n)),
+         add_all_alerts, 1.0),
+    Case("DoublyLinkedList.remove_alert (newest alert)",
+         build_alert_list,
+         lambda alerts, n: [alerts.remove_alert(f"A{n - 1 - i}") for i in range(PROBES)], 1.0),
+    Case("FixedDeque add_rear/remove_front",
+         lambda n: topic4.FixedDeque(1000, verbose=False),
+         deque_churn, 1.0),
+    Case("FixedDeque.search_command (last item)",
+         full_deque,
+         lambda fixed_deque, n: [fixed_deque.search_command(f"Check Sensor S{n - 1}") for _ in range(PROBES)], 1.0),
+    Case("Tree.add_node",
+         lambda n: build_tree(1),
+         add_tree_devices, 2.0, max_size=10_000),
+    Case("TreeNode.find_node (last device)",
+         build_tree,
+         lambda tree, n: [tree.root.find_node(f"Device {n - 1}") for _ in range(PROBES)], 1.0),
+    Case("quick_sort (distinct keys)",
+         lambda n: random_keys(n, distinct=True),
+         lambda data, n: topic7.quick_sort(data, 0, n - 1), 1.15),
+    # Lomuto partitioning degrades to O(n^2) time and O(n) recursion depth when keys repeat,
+    # as alert priorities (1-5) do. Its own smaller sizes keep it under the recursion limit
+    # while still giving the fit four points.
+    Case("quick_sort (priorities 1-5)",
+         lambda n: random_keys(n, distinct=False),
+         lambda data, n: topic7.quick_sort(data, 0, n - 1), 2.0, sizes=[250, 500, 1_000, 2_000]),
+]
+
+
+@contextlib.contextmanager
+def discarded_output():
+    """display() and traverse() always print; what they print is thrown away while they are measured."""
+    with open(os.devnull, 'w') as null_output, contextlib.redirect_stdout(null_output):
+        yield
+
+
+def time_case(case, n, min_timed=MIN_TIMED):
+    """Best of one or more runs, with garbage collection kept out of the timed section.
+
+    Runs of a few milliseconds are repeated until min_timed seconds have been timed, so a noisy
+    moment on the machine cannot decide the time of a small size.
+    """
+    best = math.inf
+    timed = 0.0
+    runs = 0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while runs == 0 or (timed < min_timed and runs < MAX_REPEATS):
+            state = case.setup(n)
+            gc.collect()  # Start every run from the same heap, with no collection pending
+            with discarded_output():
+                start = time.perf_counter()
+                case.run(state, n)
+                elapsed = time.perf_counter() - start
+            best = min(best, elapsed)
+            timed += elapsed
+            runs += 1
+            del state
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def peak_memory(case, n):
+    state = case.setup(n)
+    tracemalloc.start()
+    try:
+        with discarded_output():
+            case.run(state, n)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def fit_exponent(sizes, seconds):
+    """Least-squares slope of log(time) against log(n)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def run_case(case, max_size, measure_memory):
+    sizes = [n for n in case.sizes if n <= min(case.max_size, max_size)]
+    seconds = [math.inf] * len(sizes)
+    # Rounds over all the sizes, so a slow spell of the machine slows every size, not just the last few
+    for _ in range(ROUNDS):
+        for index, n in enumerate(sizes):
+            seconds[index] = min(seconds[index], time_case(case, n))
+    peaks = [peak_memory(case, n) if measure_memory else None for n in sizes]
+    exponent = fit_exponent(sizes, seconds) if len(sizes) > 1 else None
+    return sizes, seconds, peaks, exponent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for the home security data structures.")
+    parser.add_argument('--max-size', type=int, default=SIZES[-1], help="largest n to run (default 10^6)")
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help="allowed excess over the expected scaling exponent")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc peak-memory pass")
+    parser.add_argument('--only', help="run only cases whose name contains this text")
+    args = parser.parse_args(argv)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    regressions = []
+    for case in CASES:
+        if args.only and args.only.lower() not in case.name.lower():
+            continue
+        sizes, seconds, peaks, exponent = run_case(case, args.max_size, not args.no_memory)
+        print(f"\n{case.name}")
+        for n, elapsed, peak in zip(sizes, seconds, peaks):
+            memory = f"{peak / 1024:>10,.0f} KiB peak" if peak is not None else ""
+            print(f"  n={n:>9,}  {elapsed * 1000:>10.2f} ms  {memory}")
+        if exponent is None:
+            print("  (only one size; no exponent fitted)")
+            continue
+        status = "ok"
+        if exponent > case.expected_exponent + args.tolerance:
+            status = "REGRESSION"
+            regressions.append(case.name)
+        print(f"  fitted exponent {exponent:.2f} (expected <= {case.expected_exponent:.2f}): {status}")
+
+    if regressions:
+        print(f"\n[Error] Scaling regressed for: {', '.join(regressions)}")
+        return 1
+    print("\nAll scaling exponents within tolerance.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+# command_dispatch.py
+
+"""
+Command Dispatch: Execute the security commands queued in the Topic 4 FixedDeque.
+
+A drainer thread takes commands from the front of the deque and hands them to a pool of
+executor threads. Every command for the same device goes to the same executor, so commands
+for one device run in the order they were queued. When the deque is full, submit() waits
+until the drainer frees a slot, which pushes back on whoever is producing commands.
+"""
+
+import queue
+import threading
+import time
+import zlib
+from collections import deque
+
+from topic4 import FixedDeque, command_target
+
+
+class FakeDeviceDriver:
+    """Local stand-in for the real device driver. Records every command it executes."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay  # Seconds each command takes to "execute"
+        self.executed = []  # (device, command) pairs in execution order
+        self.lock = threading.Lock()
+
+    def execute(self, device, command):
+        if self.delay:
+            time.sleep(self.delay)
+        with self.lock:
+            self.executed.append((device, command))
+
+    def commands_for(self, device):
+        with self.lock:
+            return [command for target, command in self.executed if target == device]
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class DispatchMetrics:
+    """Queue depth and execution latency figures used to size max_size and the worker count."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.executed = 0
+        self.failed = 0  # Commands whose driver.execute() raised
+        self.blocked_submits = 0  # Submits that had to wait for a free slot
+        self.depth_total = 0
+        self.max_depth = 0
+        self.latencies = []  # Seconds from submit() to the driver finishing the command
+        self.started_at = time.perf_counter()
+
+    def record_submit(self, depth, blocked):
+        with self.lock:
+            self.submitted += 1
+            self.depth_total += depth
+            self.max_depth = max(self.max_depth, depth)
+            if blocked:
+                self.blocked_submits += 1
+
+    def record_execution(self, latency, failed=False):
+        with self.lock:
+            self.executed += 1
+            if failed:
+                self.failed += 1
+            self.latencies.append(latency)
+
+    def summary(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            elapsed = time.perf_counter() - self.started_at
+            return {
+                'submitted': self.submitted,
+                'executed': self.executed,
+                'failed': self.failed,
+                'blocked_submits': self.blocked_submits,
+                'avg_queue_depth': self.depth_total / self.submitted if self.submitted else 0.0,
+                'max_queue_depth': self.max_depth,
+                'latency_p50_ms': percentile(latencies, 0.50) * 1000,
+                'latency_p95_ms': percentile(latencies, 0.95) * 1000,
+                'latency_p99_ms': percentile(latencies, 0.99) * 1000,
+                'latency_max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+                'commands_per_sec': self.executed / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+def default_device_key(command):
+    """Device a command addresses: the same target FixedDeque coalesces on, e.g. 'thermostat'."""
+    return command_target(command)
+
+
+class CommandDispatcher:
+    def __init__(self, fixed_deque, driver, workers=4, lane_size=8, device_key=default_device_key):
+        self.fixed_deque = fixed_deque
+        self.driver = driver
+        self.workers = workers
+        self.device_key = device_key
+        self.metrics = DispatchMetrics()
+        self.condition = threading.Condition()
+        self.submit_times = deque()  # Submit time of each queued command, in deque order
+        # Small bounded lanes, so busy executors stall the drainer and the deque fills up
+        self.lanes = [queue.Queue(maxsize=lane_size) for _ in range(workers)]
+        self.threads = []
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.metrics.started_at = time.perf_counter()
+        self.threads = [threading.Thread(target=self._drain, name="dispatch-drainer", daemon=True)]
+        for index, lane in enumerate(self.lanes):
+            self.threads.append(threading.Thread(target=self._execute, args=(lane,),
+                                                 name=f"dispatch-worker-{index}", daemon=True))
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        """Stop accepting commands, finish everything already queued and join the threads."""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def submit(self, command, timeout=None):
+        """Queue a command at the rear. Blocks while the deque is full; returns False on timeout."""
+        with self.condition:
+            if not self.running:
+                raise RuntimeError("Dispatcher is not running.")
+            blocked = not self._has_room(command)
+            if blocked and not self.condition.wait_for(
+                    lambda: self._has_room(command) or not self.running, timeout):
+                return False
+            if not self.running:
+                raise RuntimeError("Dispatcher is not running.")
+            if self.fixed_deque.add_rear(command):
+                self.submit_times.append(time.perf_counter())
+            self.metrics.record_submit(len(self.fixed_deque.deque), blocked)
+            self.condition.notify_all()
+        return True
+
+    def _has_room(self, command):
+        # A command merged into one already queued (coalescing mode) needs no free slot
+        return not self.fixed_deque.is_full() or self.fixed_deque.would_coalesce(command)
+
+    def queue_depth(self):
+        with self.condition:
+            return len(self.fixed_deque.deque)
+
+    def lane_for(self, device):
+        return zlib.crc32(device.encode()) % self.workers
+
+    def _drain(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.fixed_deque.deque or not self.running)
+                if not self.fixed_deque.deque:
+                    break  # Stopped and fully drained
+                command = self.fixed_deque.remove_front()
+                submitted_at = self.submit_times.popleft()
+                self.condition.notify_all()  # Wake submitters waiting for a free slot
+            device = self.device_key(command)
+            self.lanes[self.lane_for(device)].put((device, command, submitted_at))
+        for lane in self.lanes:
+            lane.put(None)
+
+    def _execute(self, lane):
+        while True:
+            job = lane.get()
+            if job is None:
+                break
+            device, command, submitted_at = job
+            failed = False
+            try:
+                self.driver.execute(device, command)
+            except Exception:
+                failed = True  # A failing device must not stop the lane
+            finally:
+                self.metrics.record_execution(time.perf_counter() - submitted_at, failed)
+
+
+def run_sizing(max_size, workers, commands=2000, devices=20, delay=0.0005):
+    driver = FakeDeviceDriver(delay=delay)
+    dispatcher = CommandDispatcher(FixedDeque(max_size, verbose=False), driver, workers=workers)
+    with dispatcher:
+        for i in range(commands):
+            dispatcher.submit(f"Check Sensor S{i % devices}")
+    return dispatcher.metrics.summary()
+
+
+def main():
+    print("=== Command Dispatch Sizing Run (fake device driver) ===")
+    print(f"{'max_size':>8} {'workers':>7} {'cmd/s':>9} {'avg depth':>9} {'blocked':>7} "
+          f"{'p50 ms':>8} {'p99 ms':>8}")
+    for max_size in (4, 16, 64):
+        for workers in (1, 4, 8):
+            stats = run_sizing(max_size, workers)
+            print(f"{max_size:>8} {workers:>7} {stats['commands_per_sec']:>9.0f} "
+                  f"{stats['avg_queue_depth']:>9.1f} {stats['blocked_submits']:>7} "
+                  f"{stats['latency_p50_ms']:>8.2f} {stats['latency_p99_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+# command_wal.py
+
+"""
+Command WAL: Write-ahead log for the security commands queued in the Topic 4 FixedDeque.
+
+DurableFixedDeque records every mutation (add, remove, clear) in an append-only log before it
+is acknowledged as durable. Records are fsynced in groups (group commit): a background thread
+writes everything pending with one fsync when enough records pile up or the commit interval
+passes, so throughput does not drop to one fsync per command. Callers that must know a command
+is on disk call sync(). A snapshot of the deque is written every snapshot_every records and the
+log is truncated, which keeps replay time on startup bounded.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+from topic4 import FixedDeque
+
+LOG_NAME = "commands.wal"
+SNAPSHOT_NAME = "commands.snapshot"
+LOGGED_OPERATIONS = ('add_front', 'add_rear', 'remove_front', 'remove_rear', 'clear_deque')
+
+
+def fsync_directory(directory):
+    # Makes file creation and os.replace() durable; not supported on every platform
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class DurableFixedDeque(FixedDeque):
+    def __init__(self, max_size, directory, verbose=True, coalesce=False,
+                 group_size=128, commit_interval=0.005, snapshot_every=10000):
+        super().__init__(max_size, verbose=verbose, coalesce=coalesce)
+        self.directory = directory
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        self.group_size = group_size  # Pending records that trigger an immediate commit
+        self.commit_interval = commit_interval  # Longest a record waits for its fsync (seconds)
+        self.snapshot_every = snapshot_every
+        self.lsn = 0  # Sequence number of the last logged mutation
+        self.durable_lsn = 0  # Highest sequence number known to be on disk
+        self.records_since_snapshot = 0
+        self.fsyncs = 0
+        self.pending_records = []
+        self.log_condition = threading.Condition()  # Guards the pending records and sequence numbers
+        self.io_lock = threading.Lock()  # Serializes log and snapshot file I/O; always taken before log_condition
+        self.closed = False
+
+        os.makedirs(directory, exist_ok=True)
+        had_snapshot = os.path.exists(self.snapshot_path)
+        self.replayed = self.recover()
+        self.log_file = open(self.log_path, 'a', encoding='utf-8')
+        fsync_directory(directory)
+        if not had_snapshot:
+            self.snapshot()  # Records the mode and size, so a later reopen can check them
+        self.committer = threading.Thread(target=self._commit_loop, name="wal-committer", daemon=True)
+        self.committer.start()
+
+    # --- Logged mutations ---
+
+    def add_front(self, item):
+        added = super().add_front(item)
+        self._append_record('add_front', item)
+        return added
+
+    def add_rear(self, item):
+        added = super().add_rear(item)
+        self._append_record('add_rear', item)
+        return added
+
+    def remove_front(self):
+        item = super().remove_front()
+        if item is not None:
+            self._append_record('remove_front')
+        return item
+
+    def remove_rear(self):
+        item = super().remove_rear()
+        if item is not None:
+            self._append_record('remove_rear')
+        return item
+
+    def clear_deque(self):
+        super().clear_deque()
+        self._append_record('clear_deque')
+
+    # --- Group commit ---
+
+    def _append_record(self, op, item=None):
+        with self.log_condition:
+            if self.closed:
+                raise RuntimeError("Command log is closed.")
+            self.lsn += 1
+            record = {'lsn': self.lsn, 'op': op}
+            if item is not None:
+                record['item'] = item
+            self.pending_records.append(json.dumps(record) + "\n")
+            self.records_since_snapshot += 1
+            if len(self.pending_records) >= self.group_size:
+                self.log_condition.notify_all()
+            snapshot_due = self.records_since_snapshot >= self.snapshot_every
+        if snapshot_due:
+            self.snapshot()
+
+    def _commit_loop(self):
+        while True:
+            with self.log_condition:
+                self.log_condition.wait_for(
+                    lambda: len(self.pending_records) >= self.group_size or self.closed,
+                    self.commit_interval)
+                if self.closed:
+                    return  # close() commits whatever is left
+            self._commit()
+
+    def _commit(self):
+        # Take the pending records under the lock, then write and fsync without it,
+        # so mutations keep queueing records while the disk works
+        with self.io_lock:
+            with self.log_condition:
+                records, self.pending_records = self.pending_records, []
+                lsn = self.lsn
+            if records:
+                self.log_file.write("".join(records))
+                self.log_file.flush()
+                os.fsync(self.log_file.fileno())
+                self.fsyncs += 1
+            with self.log_condition:
+                self.durable_lsn = max(self.durable_lsn, lsn)
+                self.log_condition.notify_all()
+
+    def sync(self):
+        """Block until every mutation made so far is on disk."""
+        with self.log_condition:
+            target = self.lsn
+        if self.durable_lsn < target:
+            self._commit()  # Waits for any commit in progress, then writes the rest
+
+    # --- Snapshots and recovery ---
+
+    def snapshot(self):
+        """Write the deque to the snapshot file and start the log afresh."""
+        with self.io_lock:
+            with self.log_condition:
+                # The snapshot covers every record up to lsn, so the pending ones can be dropped
+                snapshot = {
+                    'lsn': self.lsn,
+                    'max_size': self.max_size,
+                    'coalesce': self.coalesce,
+                    'commands': self.commands(),
+                }
+                self.pending_records = []
+                self.records_since_snapshot = 0
+            temp_path = self.snapshot_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as snapshot_file:
+                json.dump(snapshot, snapshot_file)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            fsync_directory(self.directory)
+            self.log_file.close()
+            self.log_file = open(self.log_path, 'w', encoding='utf-8')
+            os.fsync(self.log_file.fileno())
+            with self.log_condition:
+                self.durable_lsn = max(self.durable_lsn, snapshot['lsn'])
+                self.log_condition.notify_all()
+
+    def recover(self):
+        """Load the latest snapshot and replay the log after it. Returns the records replayed.
+
+        Raises ValueError if the snapshot was written in the other coalescing mode, or if the
+        recovered commands do not fit in max_size.
+        """
+        verbose, self.verbose = self.verbose, False
+        snapshot_lsn = 0
+        replayed = 0
+        try:
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, encoding='utf-8') as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+                if snapshot['coalesce'] != self.coalesce:
+                    raise ValueError(f"'{self.snapshot_path}' was written with coalesce={snapshot['coalesce']}; "
+                                     f"reopen it with the same mode.")
+                snapshot_lsn = snapshot['lsn']
+                for command in snapshot['commands']:
+                    FixedDeque.add_rear(self, command)
+            self.lsn = snapshot_lsn
+            if os.path.exists(self.log_path):
+                with open(self.log_path, 'r+b') as log_file:
+                    good_bytes = 0
+                    for line in log_file:
+                        try:
+                            if not line.endswith(b"\n"):
+                                raise ValueError("record without its newline")
+                            record = json.loads(line)
+                        except ValueError:
+                            # Torn write at the tail from a crash; nothing after it was acknowledged.
+                            # Cut it off so records appended from now on start on a line of their own.
+                            # A record that parses but lost its newline is torn too: kept, the next
+                            # record would be appended onto its line and both would be lost later.
+                            log_file.truncate(good_bytes)
+                            break
+                        good_bytes += len(line)
+                        if record['lsn'] <= snapshot_lsn:
+                            continue
+                        if record['op'] not in LOGGED_OPERATIONS:
+                            raise ValueError(f"Unknown operation '{record['op']}' in {self.log_path}.")
+                        operation = getattr(FixedDeque, record['op'])
+                        if 'item' in record:
+                            operation(self, record['item'])
+                        else:
+                            operation(self)
+                        self.lsn = record['lsn']
+                        replayed += 1
+        finally:
+            self.verbose = verbose
+        if len(self.deque) > self.max_size:
+            raise ValueError(f"Recovered {len(self.deque)} commands, more than max_size={self.max_size}.")
+        self.durable_lsn = self.lsn
+        self.records_since_snapshot = replayed
+        return replayed
+
+    def close(self):
+        with self.log_condition:
+            if self.closed:
+                return
+            self.closed = True
+            self.log_condition.notify_all()
+        self.committer.join()
+        self._commit()
+        self.log_file.close()
+
+
+def benchmark(directory, commands=5000):
+    results = {}
+    for label, group_size in (("fsync per command", 1), ("group commit", 128)):
+        path = os.path.join(directory, label.replace(" ", "_"))
+        fixed_deque = DurableFixedDeque(64, path, verbose=False, group_size=group_size)
+        start = time.perf_counter()
+        for i in range(commands):
+            if fixed_deque.is_full():
+                fixed_deque.remove_front()
+            fixed_deque.add_rear(f"Check Sensor S{i}")
+            if group_size == 1:
+                fixed_deque.sync()
+        fixed_deque.sync()
+        elapsed = time.perf_counter() - start
+        fsyncs = fixed_deque.fsyncs
+        fixed_deque.close()
+
+        start = time.perf_counter()
+        recovered = DurableFixedDeque(64, path, verbose=False)
+        recovery = time.perf_counter() - start
+        recovered.close()
+        results[label] = (commands / elapsed, fsyncs, recovery * 1000, recovered.replayed)
+    return results
+
+
+def check_torn_tail(directory):
+    """Crash with the last record's newline unwritten, recover, append more, recover again.
+
+    Returns the commands recovered at the end; the torn record is dropped, the rest survive.
+    """
+    fixed_deque = DurableFixedDeque(8, directory, verbose=False)
+    fixed_deque.add_rear("Lock door")
+    fixed_deque.add_rear("Arm Zone 1")
+    fixed_deque.close()
+    with open(fixed_deque.log_path, 'r+b') as log_file:
+        log_file.truncate(os.path.getsize(fixed_deque.log_path) - 1)
+    fixed_deque = DurableFixedDeque(8, directory, verbose=False)
+    fixed_deque.add_rear("Arm Zone 2")
+    fixed_deque.add_rear("Unlock gate")
+    fixed_deque.sync()
+    fixed_deque.close()
+    recovered = DurableFixedDeque(8, directory, verbose=False)
+    recovered.close()
+    return recovered.commands()
+
+
+def main():
+    print("=== Command WAL Benchmark ===")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, (rate, fsyncs, recovery_ms, replayed) in benchmark(directory).items():
+            print(f"{label:>18}: {rate:>9.0f} mutations/s, {fsyncs:>5} fsyncs, "
+                  f"recovery {recovery_ms:.1f} ms ({replayed} records replayed)")
+    with tempfile.TemporaryDirectory() as directory:
+        commands = check_torn_tail(directory)
+        expected = ["Lock door", "Arm Zone 2", "Unlock gate"]
+        print(f"Recovery after a torn final newline: {commands}"
+              f"{'' if commands == expected else ' [MISMATCH]'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# compact_models.py
+
+"""
+Compact Models: Memory-lean versions of the Topic 1 Sensor, Alarm, and User classes.
+
+The classes in test.py each carry a __dict__ and keep their own copy of strings such as
+'motion', 'inactive', and 'admin'. The compact variants use __slots__, store type, status,
+state, and role as small-int enum codes, and intern location names so every sensor in the
+same room shares one string. They print the same messages and the same __str__ output.
+Running this module benchmarks bytes per object and creation throughput against test.py.
+"""
+
+import sys
+import time
+import tracemalloc
+from enum import IntEnum
+
+import test
+
+
+LABEL_LOOKUPS = {}  # Code subclass -> {label: member}; Enum's own name lookup is slow
+
+
+class Code(IntEnum):
+    @classmethod
+    def parse(cls, value):
+        """Accept a member or its lower-case name, e.g. 'motion' -> SensorType.MOTION."""
+        if isinstance(value, cls):
+            return value
+        lookup = LABEL_LOOKUPS.get(cls)
+        if lookup is None:
+            lookup = LABEL_LOOKUPS[cls] = {member.label: member for member in cls}
+        member = lookup.get(value)
+        if member is None:
+            member = lookup.get(value.strip().lower())
+        if member is None:
+            raise ValueError(f"Invalid {cls.__name__} '{value}'. Expected one of {'/'.join(lookup)}.")
+        return member
+
+    @property
+    def label(self):
+        return self.name.lower()
+
+
+class SensorType(Code):
+    MOTION = 0
+    DOOR = 1
+    WINDOW = 2
+
+
+class SensorStatus(Code):
+    INACTIVE = 0
+    ACTIVE = 1
+
+
+class AlarmType(Code):
+    SIRENE = 0
+    LIGHT = 1
+
+
+class AlarmState(Code):
+    OFF = 0
+    ON = 1
+
+
+class UserRole(Code):
+    ADMIN = 0
+    GUEST = 1
+
+
+class CompactSensor:
+    __slots__ = ('sensor_id', 'sensor_type', 'location', 'status')
+
+    def __init__(self, sensor_id, sensor_type, location):
+        self.sensor_id = sensor_id
+        self.sensor_type = SensorType.parse(sensor_type)
+        self.location = sys.intern(location)  # Sensors in the same room share one string
+        self.status = SensorStatus.INACTIVE
+
+    def activate(self):
+        self.status = SensorStatus.ACTIVE
+        print(f"Sensor {self.sensor_id} activated.")
+
+    def deactivate(self):
+        self.status = SensorStatus.INACTIVE
+        print(f"Sensor {self.sensor_id} deactivated.")
+
+    def __str__(self):
+        return (f"Sensor(ID:{self.sensor_id}, Type:{self.sensor_type.label}, "
+                f"Location:{self.location}, Status:{self.status.label})")
+
+
+class CompactAlarm:
+    __slots__ = ('alarm_id', 'alarm_type', 'state')
+
+    def __init__(self, alarm_id, alarm_type):
+        self.alarm_id = alarm_id
+        self.alarm_type = AlarmType.parse(alarm_type)
+        self.state = AlarmState.OFF
+
+    def turn_on(self):
+        self.state = AlarmState.ON
+        print(f"Alarm {self.alarm_id} turned on.")
+
+    def turn_off(self):
+        self.state = AlarmState.OFF
+        print(f"Alarm {self.alarm_id} turned off.")
+
+    def __str__(self):
+        return f"Alarm(ID:{self.alarm_id}, Type:{self.alarm_type.label}, State:{self.state.label})"
+
+
+class CompactUser:
+    __slots__ = ('user_id', 'name', 'role')
+
+    def __init__(self, user_id, name, role):
+        self.user_id = user_id
+        self.name = name
+        self.role = UserRole.parse(role)
+
+    def __str__(self):
+        return f"User(ID:{self.user_id}, Name:{self.name}, Role:{self.role.label})"
+
+
+def measure(factory, count):
+    """Return (bytes per object, objects created per second) for count calls of factory(i)."""
+    # Object IDs are built up front so both variants are charged only for what they keep
+    ids = [f"X{i}" for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i, ids[i]) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+
+    start = time.perf_counter()
+    objects = [factory(i, ids[i]) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    return used / count, count / elapsed
+
+
+def fresh(text):
+    # A new string object with the same value, like each input() call produces
+    return text.lower()
+
+
+SENSOR_TYPES = ['motion', 'door', 'window']
+LOCATIONS = [f"Room {room}" for room in range(50)]
+
+BENCHMARKS = [
+    ("Sensor",
+     lambda i, object_id: test.Sensor(object_id, fresh(SENSOR_TYPES[i % 3]), fresh(LOCATIONS[i % 50])),
+     lambda i, object_id: CompactSensor(object_id, fresh(SENSOR_TYPES[i % 3]), fresh(LOCATIONS[i % 50]))),
+    ("Alarm",
+     lambda i, object_id: test.Alarm(object_id, fresh('sirene' if i % 2 else 'light')),
+     lambda i, object_id: CompactAlarm(object_id, fresh('sirene' if i % 2 else 'light'))),
+    ("User",
+     lambda i, object_id: test.User(object_id, f"User {i}", fresh('admin' if i % 10 == 0 else 'guest')),
+     lambda i, object_id: CompactUser(object_id, f"User {i}", fresh('admin' if i % 10 == 0 else 'guest'))),
+]
+
+
+def main(count=200_000):
+    print(f"=== Compact Model Benchmark ({count:,} objects per class) ===")
+    print(f"{'Class':<8} {'Variant':<8} {'bytes/object':>12} {'objects/s':>12}")
+    for name, original, compact in BENCHMARKS:
+        for variant, factory in (("test.py", original), ("compact", compact)):
+            bytes_per_object, rate = measure(factory, count)
+            print(f"{name:<8} {variant:<8} {bytes_per_object:>12.1f} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
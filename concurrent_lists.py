@@ -0,0 +1,339 @@
+# concurrent_lists.py
+
+"""
+Concurrent Lists: Thread-safe, sharded variants of the Topic 2, 3, and 5 linked lists.
+
+Sensor reader threads append to ShardedEventLog and ShardedAlertList without sharing a lock:
+each sensor ID hashes to one shard, and every shard has its own lock, head, and tail, so threads
+reading different sensors rarely contend. A shard stamps each node with a global sequence number
+while holding its lock, which keeps every shard sorted by sequence; iterating merges the shards
+on that number to recover global arrival order. Events from one sensor always share a shard, so
+their relative order is exact.
+
+Alert IDs are unique across all shards, so ShardedAlertList keeps one ID -> shard map behind one
+short-held lock that every add and remove takes. Partitioning that map by alert ID was tried and
+made no measurable difference to main()'s alert benchmark under the GIL, so the single map stays.
+
+Sharding removes the shared lock, not the GIL. On a standard CPython build only one thread runs
+Python code at a time, so neither the sharded nor the single-lock lists get faster as reader
+threads are added; the benchmark in main() shows roughly flat, noisy throughput for both. The
+sharded lists only scale on a free-threaded build; on a standard build use processes instead
+(see alert_cluster.py).
+
+LockedCircularList is the Topic 3 rotation list behind a single lock. It is a shared schedule
+rather than an ingestion path, so it is not sharded.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+import zlib
+
+from topic2 import SinglyNode
+from topic3 import CircularLinkedList
+from topic5 import Alert, DoublyLinkedList
+
+
+def shard_for(sensor_id, shard_count):
+    return zlib.crc32(str(sensor_id).encode('utf-8')) % shard_count
+
+
+class SequencedNode:
+    __slots__ = ('data', 'next', 'seq')
+
+    def __init__(self, data, seq):
+        self.data = data  # Event data
+        self.next = None
+        self.seq = seq  # Global arrival order
+
+
+class SequencedDoublyNode:
+    __slots__ = ('data', 'prev', 'next', 'seq')
+
+    def __init__(self, data, seq):
+        self.data = data  # Alert object
+        self.prev = None
+        self.next = None
+        self.seq = seq
+
+
+class EventShard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.head = None
+        self.tail = None
+        self.count = 0
+
+    def nodes(self):
+        """Walk the nodes present when called; nodes are never unlinked, so no lock is held while walking."""
+        with self.lock:
+            node, count = self.head, self.count
+        for _ in range(count):
+            yield node
+            node = node.next
+
+
+class ShardedEventLog:
+    def __init__(self, shards=16, verbose=False):
+        self.shards = [EventShard() for _ in range(shards)]
+        self.shard_of = {}  # Sensor ID -> shard, so the hash is computed once per sensor
+        self.sequence = itertools.count()
+        self.verbose = verbose
+
+    def append(self, data, sensor_id):
+        shard = self.shard_of.get(sensor_id)
+        if shard is None:
+            shard = self.shard_of[sensor_id] = self.shards[shard_for(sensor_id, len(self.shards))]
+        with shard.lock:
+            new_node = SequencedNode(data, next(self.sequence))
+            if shard.tail:
+                shard.tail.next = new_node
+            else:
+                shard.head = new_node
+            shard.tail = new_node
+            shard.count += 1
+        if self.verbose:
+            print(f"[Event Log] Appended '{data}' to the event log.")
+
+    def __len__(self):
+        return sum(shard.count for shard in self.shards)
+
+    def __iter__(self):
+        """Yield events in global arrival order."""
+        for node in heapq.merge(*(shard.nodes() for shard in self.shards), key=lambda node: node.seq):
+            yield node.data
+
+    def display(self):
+        elems = [str(data) for data in self]
+        print("Event Logs:", " -> ".join(elems) if elems else "No events recorded.")
+
+
+class AlertShard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.head = None
+        self.tail = None
+        self.nodes = {}  # Alert ID -> node, so resolving an alert does not walk the shard
+
+
+class ShardedAlertList:
+    def __init__(self, shards=16, verbose=False):
+        self.shards = [AlertShard() for _ in range(shards)]
+        self.shard_of = {}  # Sensor ID -> shard, so the hash is computed once per sensor
+        self.sequence = itertools.count()
+        self.verbose = verbose
+        # Alert ID -> shard, across all shards. Alert IDs are unique globally, not per sensor, and this
+        # also lets remove_alert go straight to the right shard. Lock order: a shard lock, then ids_lock.
+        self.ids_lock = threading.Lock()
+        self.alert_shards = {}
+
+    def add_alert(self, alert):
+        shard = self.shard_of.get(alert.sensor_id)
+        if shard is None:
+            shard = self.shard_of[alert.sensor_id] = self.shards[shard_for(alert.sensor_id, len(self.shards))]
+        with shard.lock:
+            with self.ids_lock:
+                added = alert.alert_id not in self.alert_shards
+                if added:
+                    self.alert_shards[alert.alert_id] = shard
+            if added:
+                new_node = SequencedDoublyNode(alert, next(self.sequence))
+                if shard.tail:
+                    shard.tail.next = new_node
+                    new_node.prev = shard.tail
+                else:
+                    shard.head = new_node
+                shard.tail = new_node
+                shard.nodes[alert.alert_id] = new_node
+        if self.verbose:
+            if added:
+                print(f"[Active Alerts] Added '{alert.alert_id}' to active alerts.")
+            else:
+                print(f"[Error] Alert ID '{alert.alert_id}' already exists.")
+        return added
+
+    def remove_alert(self, alert_id):
+        with self.ids_lock:
+            shard = self.alert_shards.get(alert_id)
+        current = None
+        if shard is not None:
+            with shard.lock:
+                current = shard.nodes.pop(alert_id, None)
+                if current is not None:
+                    with self.ids_lock:
+                        del self.alert_shards[alert_id]
+                    if current.prev:
+                        current.prev.next = current.next
+                    else:
+                        shard.head = current.next
+                    if current.next:
+                        current.next.prev = current.prev
+                    else:
+                        shard.tail = current.prev
+        if self.verbose:
+            if current is not None:
+                print(f"[Active Alerts] Resolved and removed alert '{alert_id}'.")
+            else:
+                print(f"[Active Alerts] Alert '{alert_id}' not found.")
+        return current is not None
+
+    def __len__(self):
+        return sum(len(shard.nodes) for shard in self.shards)
+
+    def snapshot(self):
+        """Active alerts in global arrival order. Each shard is copied under its lock, since alerts can be unlinked."""
+        copies = []
+        for shard in self.shards:
+            with shard.lock:
+                items = []
+                current = shard.head
+                while current:
+                    items.append((current.seq, current.data))
+                    current = current.next
+            copies.append(items)
+        return [alert for _, alert in heapq.merge(*copies, key=lambda item: item[0])]
+
+    def display_alerts(self):
+        alerts = self.snapshot()
+        if not alerts:
+            print("Active Alerts: [No active alerts]")
+            return
+        print("Active Alerts:")
+        for alert in alerts:
+            print(f"  ID: {alert.alert_id}, Type: {alert.alert_type}, "
+                  f"Sensor: {alert.sensor_id}, Priority: {alert.priority}, "
+                  f"Time: {alert.timestamp}, Message: {alert.message}")
+
+
+class LockedCircularList(CircularLinkedList):
+    def __init__(self, verbose=True):
+        super().__init__(verbose)
+        self.lock = threading.RLock()
+
+    def append(self, data):
+        with self.lock:
+            super().append(data)
+
+    def remove(self, data):
+        with self.lock:
+            return super().remove(data)
+
+    def display(self):
+        with self.lock:
+            super().display()
+
+    def traverse(self, steps):
+        with self.lock:
+            super().traverse(steps)
+
+
+class LockedEventLog:
+    """Reference: one list behind one lock, which every writer thread serializes on."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.head = None
+        self.tail = None
+
+    def append(self, data, sensor_id):
+        with self.lock:
+            new_node = SinglyNode(data)
+            if self.tail:
+                self.tail.next = new_node
+            else:
+                self.head = new_node
+            self.tail = new_node
+
+
+class LockedAlertList:
+    """Reference: the Topic 5 alert list and an ID set behind one lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.alerts = DoublyLinkedList(verbose=False)
+        self.alert_ids = set()
+
+    def add_alert(self, alert):
+        with self.lock:
+            if alert.alert_id in self.alert_ids:
+                return False
+            self.alert_ids.add(alert.alert_id)
+            self.alerts.add_alert(alert)
+            return True
+
+
+def ingest_alerts(alert_list, threads, alerts_per_thread, sensors_per_thread=50):
+    """Each thread raises alerts for its own sensors. Returns alerts per second."""
+    barrier = threading.Barrier(threads + 1)
+
+    def reader(worker):
+        alerts = [Alert(f"A{worker}-{i}", f"S{worker}-{i % sensors_per_thread}", 'intrusion', 1, "benchmark")
+                  for i in range(alerts_per_thread)]
+        add_alert = alert_list.add_alert
+        barrier.wait()
+        for alert in alerts:
+            add_alert(alert)
+
+    workers = [threading.Thread(target=reader, args=(worker,)) for worker in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * alerts_per_thread / (time.perf_counter() - start)
+
+
+def ingest(event_log, threads, events_per_thread, sensors_per_thread=50):
+    """Each thread reads its own sensors and appends their events. Returns events per second."""
+    barrier = threading.Barrier(threads + 1)
+
+    def reader(worker):
+        sensor_ids = [f"S{worker}-{i}" for i in range(sensors_per_thread)]
+        append = event_log.append
+        barrier.wait()
+        for i in range(events_per_thread):
+            sensor_id = sensor_ids[i % sensors_per_thread]
+            append(f"Sensor {sensor_id} triggered", sensor_id)
+
+    workers = [threading.Thread(target=reader, args=(worker,)) for worker in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * events_per_thread / (time.perf_counter() - start)
+
+
+def main(events_per_thread=100_000):
+    print("=== Concurrent Event Ingestion ===")
+    print(f"{'threads':>7} {'single lock ev/s':>18} {'sharded ev/s':>14}")
+    for threads in (1, 2, 4, 8):
+        locked = ingest(LockedEventLog(), threads, events_per_thread)
+        sharded_log = ShardedEventLog()
+        sharded = ingest(sharded_log, threads, events_per_thread)
+        print(f"{threads:>7} {locked:>18,.0f} {sharded:>14,.0f}")
+
+    sequences = [node.seq for node in heapq.merge(*(shard.nodes() for shard in sharded_log.shards),
+                                                  key=lambda node: node.seq)]
+    print(f"Merged iteration: {len(sequences):,} events, "
+          f"{'in global order' if sequences == sorted(sequences) else 'OUT OF ORDER'}")
+
+    print(f"\n{'threads':>7} {'single lock al/s':>18} {'sharded al/s':>14}")
+    for threads in (1, 2, 4, 8):
+        locked = ingest_alerts(LockedAlertList(), threads, events_per_thread // 4)
+        sharded = ingest_alerts(ShardedAlertList(), threads, events_per_thread // 4)
+        print(f"{threads:>7} {locked:>18,.0f} {sharded:>14,.0f}")
+
+    alerts = ShardedAlertList()
+    for i in range(10):
+        alerts.add_alert(Alert(f"A{i}", f"S{i % 3}", 'intrusion', i % 3 + 1, f"Alert {i}"))
+    alerts.remove_alert("A4")
+    alerts.remove_alert("A7")
+    print("Active alerts in arrival order:", ", ".join(alert.alert_id for alert in alerts.snapshot()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# event_index.py
+
+"""
+Event Index: Timestamped event records and a block-level time index over the Topic 2 event log.
+
+IndexedEventLog is a SinglyLinkedList whose nodes hold TimestampedEvent records. Every
+block_size consecutive events form a block; the index keeps, per block, a reference to the
+block's first node and the block's earliest and latest timestamps. A running maximum of the
+block maxima is non-decreasing, so a time-range query binary-searches it to find the first block
+that can hold a match and walks the list from there. For a log appended in time order that costs
+O(log n + k) plus at most one partial block, and the matching events are streamed straight from
+the list nodes without copying the log.
+"""
+
+import random
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from topic2 import SinglyLinkedList
+
+
+class TimestampedEvent:
+    __slots__ = ('timestamp', 'description')
+
+    def __init__(self, description, timestamp=None):
+        self.description = description
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+
+    def __str__(self):
+        return f"[{self.timestamp:%Y-%m-%d %H:%M:%S}] {self.description}"
+
+
+class EventBlock:
+    __slots__ = ('first_node', 'min_time', 'max_time', 'count')
+
+    def __init__(self, first_node, timestamp):
+        self.first_node = first_node
+        self.min_time = timestamp
+        self.max_time = timestamp
+        self.count = 1
+
+
+class IndexedEventLog(SinglyLinkedList):
+    def __init__(self, block_size=64, verbose=True):
+        super().__init__(verbose=verbose)
+        self.block_size = block_size
+        self.blocks = []
+        self.running_max = []  # running_max[i] = latest timestamp in blocks[0..i]
+        self.in_order = True  # False once an event arrives with an earlier timestamp than its predecessor
+        self.count = 0
+
+    def append(self, data, timestamp=None):
+        """Append a TimestampedEvent, or a description (stamped with timestamp or the current time)."""
+        event = data if isinstance(data, TimestampedEvent) else TimestampedEvent(data, timestamp)
+        when = event.timestamp
+        if self.running_max and when < self.running_max[-1]:
+            self.in_order = False
+        super().append(event)
+        self.count += 1
+
+        blocks = self.blocks
+        if not blocks or blocks[-1].count >= self.block_size:
+            blocks.append(EventBlock(self.tail, when))
+            self.running_max.append(max(self.running_max[-1], when) if self.running_max else when)
+            return
+        block = blocks[-1]
+        block.count += 1
+        if when < block.min_time:
+            block.min_time = when
+        if when > block.max_time:
+            block.max_time = when
+            if when > self.running_max[-1]:
+                self.running_max[-1] = when
+
+    def range(self, start, end):
+        """Yield events with start <= timestamp <= end, in log order."""
+        blocks = self.blocks
+        for block_index in range(bisect_left(self.running_max, start), len(blocks)):
+            block = blocks[block_index]
+            if block.min_time > end:
+                if self.in_order:
+                    return  # Every later block is later still
+                continue
+            if block.max_time < start:
+                continue
+            node = block.first_node
+            for _ in range(block.count):
+                event = node.data
+                if start <= event.timestamp <= end:
+                    yield event
+                node = node.next
+
+    def count_range(self, start, end):
+        return sum(1 for _ in self.range(start, end))
+
+    def display_range(self, start, end):
+        events = [str(event) for event in self.range(start, end)]
+        print(f"Events {start:%H:%M:%S}-{end:%H:%M:%S}:", " -> ".join(events) if events else "No events recorded.")
+
+
+def full_scan(event_log, start, end):
+    """Reference query: walk every node from head, as the plain event log requires."""
+    current = event_log.head
+    while current:
+        if start <= current.data.timestamp <= end:
+            yield current.data
+        current = current.next
+
+
+def main():
+    event_count = 1_000_000
+    rng = random.Random(3)
+    day = datetime(2025, 1, 5)
+    print(f"=== Event Log Time Index ({event_count:,} events over one day) ===")
+
+    event_log = IndexedEventLog(verbose=False)
+    seconds = sorted(rng.uniform(0, 86_400) for _ in range(event_count))
+    start = time.perf_counter()
+    for i, offset in enumerate(seconds):
+        event_log.append(f"Sensor S{i % 500} triggered", day + timedelta(seconds=offset))
+    print(f"Build log and index: {(time.perf_counter() - start) * 1000:,.0f} ms "
+          f"({len(event_log.blocks):,} blocks)")
+
+    for label, begin, minutes in (("14:00-14:30", 14 * 60, 30), ("09:00-09:01", 9 * 60, 1)):
+        window_start = day + timedelta(minutes=begin)
+        window_end = window_start + timedelta(minutes=minutes)
+        start = time.perf_counter()
+        indexed = event_log.count_range(window_start, window_end)
+        indexed_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        scanned = sum(1 for _ in full_scan(event_log, window_start, window_end))
+        scan_ms = (time.perf_counter() - start) * 1000
+        print(f"{label}: {indexed:,} events, indexed {indexed_ms:.2f} ms vs full scan {scan_ms:.2f} ms"
+              f"{'' if indexed == scanned else ' [MISMATCH]'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# event_search.py
+
+"""
+Event Search: Inverted-index keyword search over the Topic 2 event log.
+
+SearchableEventLog is a SinglyLinkedList that also feeds every appended event into an
+InvertedIndex: each lower-cased word token ("s1", "intrusion", ...) maps to a posting list of the
+positions of the events that contain it. Posting lists only ever grow at the end, so they stay
+sorted without extra work. AND queries walk the shortest posting list and binary-search the
+others, OR queries merge the posting lists, and prefix queries take the matching range of the
+vocabulary, so none of them walk the log itself. New tokens are appended to the vocabulary as they
+appear, and it is sorted on the next prefix query rather than on every insert. Query terms go
+through the same tokenizer as events, so "Door-Opened" asks for both "door" and "opened".
+"""
+
+import heapq
+import random
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
+
+from event_index import TimestampedEvent
+from topic2 import SinglyLinkedList
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def query_tokens(terms):
+    return [token for term in terms for token in tokenize(term)]
+
+
+def contains(postings, position):
+    index = bisect_left(postings, position)
+    return index < len(postings) and postings[index] == position
+
+
+class InvertedIndex:
+    def __init__(self):
+        self.postings = {}  # Token -> array of event positions, ascending
+        self.vocabulary = []  # Tokens, for prefix queries; sorted lazily
+        self.vocabulary_sorted = True
+        self.count = 0  # Events indexed so far; the next event gets this position
+
+    def add(self, text):
+        position = self.count
+        self.count += 1
+        for token in set(tokenize(text)):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array('I')
+                self.vocabulary.append(token)
+                self.vocabulary_sorted = False
+            postings.append(position)
+        return position
+
+    def all_of(self, *terms):
+        """Positions of events containing every term."""
+        tokens = query_tokens(terms)
+        if not tokens:
+            return []
+        lists = []
+        for token in tokens:
+            postings = self.postings.get(token)
+            if not postings:
+                return []
+            lists.append(postings)
+        lists.sort(key=len)
+        shortest, others = lists[0], lists[1:]
+        return [position for position in shortest
+                if all(contains(postings, position) for postings in others)]
+
+    def any_of(self, *terms):
+        """Positions of events containing at least one term."""
+        lists = [self.postings[token] for token in set(query_tokens(terms)) if token in self.postings]
+        positions = []
+        for position in heapq.merge(*lists):
+            if not positions or positions[-1] != position:
+                positions.append(position)
+        return positions
+
+    def with_prefix(self, prefix):
+        """Positions of events containing any token that starts with prefix."""
+        tokens = tokenize(prefix)
+        if len(tokens) != 1:
+            return []  # No single token can start with an empty prefix or one spanning several words
+        prefix = tokens[0]
+        if not self.vocabulary_sorted:
+            self.vocabulary.sort()
+            self.vocabulary_sorted = True
+        vocabulary = self.vocabulary
+        index = bisect_left(vocabulary, prefix)
+        tokens = []
+        while index < len(vocabulary) and vocabulary[index].startswith(prefix):
+            tokens.append(vocabulary[index])
+            index += 1
+        return self.any_of(*tokens)
+
+    def memory_bytes(self):
+        """Approximate memory held by the index (dict, posting arrays, vocabulary)."""
+        total = sys.getsizeof(self.postings) + sys.getsizeof(self.vocabulary)
+        for token, postings in self.postings.items():
+            total += sys.getsizeof(token) + sys.getsizeof(postings)
+        return total
+
+
+class SearchableEventLog(SinglyLinkedList):
+    def __init__(self, verbose=True):
+        super().__init__(verbose=verbose)
+        self.index = InvertedIndex()
+        self.events = []  # Position -> event, so results are fetched without walking the list
+
+    def append(self, data):
+        super().append(data)
+        text = data.description if isinstance(data, TimestampedEvent) else str(data)
+        self.index.add(text)
+        self.events.append(data)
+
+    def search_all(self, *terms):
+        return [self.events[position] for position in self.index.all_of(*terms)]
+
+    def search_any(self, *terms):
+        return [self.events[position] for position in self.index.any_of(*terms)]
+
+    def search_prefix(self, prefix):
+        return [self.events[position] for position in self.index.with_prefix(prefix)]
+
+    def memory_report(self):
+        """Bytes held by the raw log (nodes and event strings) and added by the search index."""
+        log_bytes = 0
+        current = self.head
+        while current:
+            log_bytes += sys.getsizeof(current) + sys.getsizeof(current.__dict__) + sys.getsizeof(current.data)
+            current = current.next
+        index_bytes = self.index.memory_bytes() + sys.getsizeof(self.events)
+        return {'log_bytes': log_bytes, 'index_bytes': index_bytes,
+                'overhead_ratio': index_bytes / log_bytes if log_bytes else 0.0}
+
+
+def scan(event_log, predicate):
+    """Reference query: compare the text of every node, as the plain event log requires."""
+    matches = []
+    current = event_log.head
+    while current:
+        if predicate(current.data):
+            matches.append(current.data)
+        current = current.next
+    return matches
+
+
+def main():
+    event_count = 300_000
+    rng = random.Random(11)
+    causes = ['intrusion', 'motion', 'door opened', 'window opened', 'smoke', 'temperature anomaly']
+    print(f"=== Event Log Keyword Search ({event_count:,} events) ===")
+
+    event_log = SearchableEventLog(verbose=False)
+    start = time.perf_counter()
+    for i in range(event_count):
+        event_log.append(f"Sensor S{rng.randrange(2000)} triggered by {rng.choice(causes)} "
+                         f"at {rng.randrange(24):02d}:{rng.randrange(60):02d}")
+    print(f"Build log and index: {(time.perf_counter() - start) * 1000:,.0f} ms")
+
+    queries = [
+        ("AND s1 intrusion", lambda: event_log.search_all("S1", "intrusion"),
+         lambda text: "intrusion" in tokenize(text) and "s1" in tokenize(text)),
+        ("OR smoke temperature", lambda: event_log.search_any("smoke", "temperature"),
+         lambda text: bool({"smoke", "temperature"} & set(tokenize(text)))),
+        ("PREFIX s19", lambda: event_log.search_prefix("s19"),
+         lambda text: any(token.startswith("s19") for token in tokenize(text))),
+    ]
+    for label, query, predicate in queries:
+        start = time.perf_counter()
+        results = query()
+        indexed_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        scanned = scan(event_log, predicate)
+        scan_ms = (time.perf_counter() - start) * 1000
+        print(f"{label:<22} {len(results):>7,} events  indexed {indexed_ms:8.2f} ms  "
+              f"scan {scan_ms:8.2f} ms{'' if len(results) == len(scanned) else ' [MISMATCH]'}")
+
+    report = event_log.memory_report()
+    print(f"Memory: raw log {report['log_bytes'] / 2**20:.1f} MiB, index {report['index_bytes'] / 2**20:.1f} MiB "
+          f"({report['overhead_ratio']:.0%} overhead)")
+
+
+if __name__ == "__main__":
+    main()
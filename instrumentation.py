@@ -0,0 +1,282 @@
+# instrumentation.py
+
+"""
+Instrumentation: Opt-in per-operation counters, latency histograms, and profiling for every structure.
+
+When enabled, the operations listed in TARGETS (append, remove, find_node, search_command,
+quick_sort, ...) are wrapped so each call is counted and its latency lands in a log2-bucketed
+histogram. One operation at a time can also be captured with cProfile. Disabling puts the
+original functions back, so instrumentation costs nothing while it is off.
+
+Each topic menu has an "S. Operation Stats" option that opens stats_menu(). Code that imported a
+function directly (e.g. `from topic7 import quick_sort`) keeps the uninstrumented version.
+
+Recursive operations (quick_sort, find_node) are undercounted when called from several threads at
+once: while one thread's outermost call runs, the name points at the original function, so calls
+from other threads in that window are not recorded.
+"""
+
+import cProfile
+import importlib
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+
+# (module, attribute path) of every instrumented operation
+TARGETS = [
+    ('topic2', 'SinglyLinkedList.append'),
+    ('topic2', 'SinglyLinkedList.display'),
+    ('topic2', 'DoublyLinkedList.append'),
+    ('topic2', 'DoublyLinkedList.remove'),
+    ('topic3', 'CircularLinkedList.append'),
+    ('topic3', 'CircularLinkedList.remove'),
+    ('topic3', 'CircularLinkedList.traverse'),
+    ('topic4', 'FixedDeque.add_front'),
+    ('topic4', 'FixedDeque.add_rear'),
+    ('topic4', 'FixedDeque.remove_front'),
+    ('topic4', 'FixedDeque.remove_rear'),
+    ('topic4', 'FixedDeque.search_command'),
+    ('topic5', 'DoublyLinkedList.add_alert'),
+    ('topic5', 'DoublyLinkedList.remove_alert'),
+    ('topic6', 'TreeNode.find_node'),
+    ('topic6', 'Tree.add_node'),
+    ('topic6', 'Tree.remove_node'),
+    ('topic6', 'Tree.move_node'),
+    ('topic7', 'quick_sort'),
+]
+# Operations that call themselves through the patched name; only the outermost call is timed.
+# For the duration of that call the name is bound back to the original function, so inner calls
+# skip the wrapper and recurse exactly as deep as they do without instrumentation.
+RECURSIVE = {'topic6.TreeNode.find_node', 'topic7.quick_sort'}
+
+
+class LatencyHistogram:
+    """Counts latencies in power-of-two nanosecond buckets: bucket b holds [2^(b-1), 2^b) ns."""
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, elapsed_ns):
+        self.buckets[elapsed_ns.bit_length()] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def percentile_ns(self, fraction):
+        """Upper bound of the bucket holding the given fraction of calls."""
+        threshold = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= threshold:
+                return min(1 << bucket, self.max_ns)
+        return self.max_ns
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_us': self.total_ns / self.count / 1e3 if self.count else 0.0,
+            'p50_us': self.percentile_ns(0.50) / 1e3,
+            'p99_us': self.percentile_ns(0.99) / 1e3,
+            'max_us': self.max_ns / 1e3,
+            'buckets': {f"<{1 << bucket}ns": count for bucket, count in enumerate(self.buckets) if count},
+        }
+
+
+def resolve_module(name):
+    # A topic run as a script lives in __main__, and that is the copy its menu uses
+    main = sys.modules.get('__main__')
+    main_file = getattr(main, '__file__', None)
+    if main_file and os.path.splitext(os.path.basename(main_file))[0] == name:
+        return main
+    return importlib.import_module(name)
+
+
+class Instrumentation:
+    def __init__(self, targets=TARGETS):
+        self.targets = targets
+        self.histograms = {}  # Label -> LatencyHistogram
+        self.originals = []  # (owner, attribute, original function) while enabled
+        self.enabled = False
+        self.depth = threading.local()  # Recursive calls (quick_sort, find_node) are timed once
+        self.profiled_label = None
+        self.profiler = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        for module_name, path in self.targets:
+            owner = resolve_module(module_name)
+            *owner_path, attribute = path.split('.')
+            for name in owner_path:
+                owner = getattr(owner, name)
+            original = owner.__dict__[attribute]
+            label = f"{module_name}.{path}"
+            self.histograms.setdefault(label, LatencyHistogram())
+            setattr(owner, attribute, self._wrap(original, label, owner, attribute))
+            self.originals.append((owner, attribute, original))
+        self.enabled = True
+
+    def disable(self):
+        for owner, attribute, original in reversed(self.originals):
+            setattr(owner, attribute, original)
+        self.originals = []
+        self.enabled = False
+
+    def _wrap(self, function, label, owner, attribute):
+        record = self.histograms[label].record
+        clock = time.perf_counter_ns
+
+        if label not in RECURSIVE:
+            def instrumented(*args, **kwargs):
+                if self.profiled_label == label:
+                    return self._call_profiled(function, record, args, kwargs)
+                start = clock()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    record(clock() - start)
+        else:
+            depth = self.depth
+
+            def instrumented(*args, **kwargs):
+                if getattr(depth, label, 0):
+                    # Inner call on this thread (depth is thread-local): another thread's outermost
+                    # call ended and put the wrapper back while this one was still running
+                    return function(*args, **kwargs)
+                setattr(depth, label, 1)
+                setattr(owner, attribute, function)  # Inner calls go straight to the original
+                try:
+                    if self.profiled_label == label:
+                        return self._call_profiled(function, record, args, kwargs)
+                    start = clock()
+                    try:
+                        return function(*args, **kwargs)
+                    finally:
+                        record(clock() - start)
+                finally:
+                    setattr(depth, label, 0)
+                    # Put the wrapper back, unless instrumentation was disabled during the call
+                    if self.enabled and owner.__dict__.get(attribute) is function:
+                        setattr(owner, attribute, instrumented)
+
+        instrumented.__wrapped__ = function
+        instrumented.__name__ = function.__name__
+        instrumented.__doc__ = function.__doc__
+        return instrumented
+
+    def _call_profiled(self, function, record, args, kwargs):
+        profiler = self.profiler
+        profiler.enable()
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record(time.perf_counter_ns() - start)
+            profiler.disable()
+
+    def labels(self):
+        return [f"{module_name}.{path}" for module_name, path in self.targets]
+
+    def profile(self, label):
+        """Capture every call of one operation with cProfile (replaces any earlier capture)."""
+        if label not in self.labels():
+            raise ValueError(f"Unknown operation '{label}'.")
+        self.profiled_label = label
+        self.profiler = cProfile.Profile()
+
+    def profile_report(self, limit=15):
+        if not self.profiler:
+            return "No operation is being profiled."
+        output = io.StringIO()
+        try:
+            pstats.Stats(self.profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+        except TypeError:
+            return f"No calls of '{self.profiled_label}' captured yet."
+        return output.getvalue()
+
+    def stats(self):
+        return {label: histogram.summary()
+                for label, histogram in self.histograms.items() if histogram.count}
+
+    def export_json(self, path):
+        with open(path, 'w', encoding='utf-8') as stats_file:
+            json.dump({'enabled': self.enabled, 'operations': self.stats()}, stats_file, indent=2)
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.__init__()
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def display_stats(instrumentation=INSTRUMENTATION):
+    stats = instrumentation.stats()
+    if not stats:
+        print("[Stats] No operations recorded yet.")
+        return
+    print(f"{'Operation':<40} {'calls':>8} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'max us':>9}")
+    for label, summary in sorted(stats.items(), key=lambda item: item[1]['total_ms'], reverse=True):
+        print(f"{label:<40} {summary['count']:>8} {summary['mean_us']:>9.1f} {summary['p50_us']:>9.1f} "
+              f"{summary['p99_us']:>9.1f} {summary['max_us']:>9.1f}")
+
+
+def stats_menu(instrumentation=INSTRUMENTATION):
+    while True:
+        state = "enabled" if instrumentation.enabled else "disabled"
+        print(f"\n--- Operation Stats (instrumentation {state}) ---")
+        print("1. Show Stats")
+        print("2. Enable/Disable Instrumentation")
+        print("3. Profile an Operation")
+        print("4. Show Profile")
+        print("5. Export Stats to JSON")
+        print("6. Reset Stats")
+        print("7. Back")
+        choice = input("Select an option (1-7): ").strip()
+
+        if choice == '1':
+            display_stats(instrumentation)
+        elif choice == '2':
+            if instrumentation.enabled:
+                instrumentation.disable()
+                print("[Stats] Instrumentation disabled.")
+            else:
+                instrumentation.enable()
+                print("[Stats] Instrumentation enabled.")
+        elif choice == '3':
+            labels = instrumentation.labels()
+            for index, label in enumerate(labels, start=1):
+                print(f"  {index}. {label}")
+            selection = input("Select an operation to profile: ").strip()
+            if selection.isdigit() and 1 <= int(selection) <= len(labels):
+                instrumentation.profile(labels[int(selection) - 1])
+                instrumentation.enable()
+                print(f"[Stats] Profiling '{labels[int(selection) - 1]}'.")
+            else:
+                print("[Error] Invalid selection.")
+        elif choice == '4':
+            print(instrumentation.profile_report())
+        elif choice == '5':
+            path = input("Enter file name (e.g., 'stats.json'): ").strip()
+            if path:
+                instrumentation.export_json(path)
+                print(f"[Stats] Exported to '{path}'.")
+            else:
+                print("[Error] File name cannot be empty.")
+        elif choice == '6':
+            instrumentation.reset()
+            print("[Stats] Stats reset.")
+        elif choice == '7':
+            break
+        else:
+            print("[Error] Invalid choice. Please select a number between 1 and 7.")
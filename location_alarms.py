@@ -0,0 +1,215 @@
+# location_alarms.py
+
+"""
+Location Alarms: A precomputed map from each Topic 6 tree node to the alarms covering it.
+
+Alarms (test.py) are attached to nodes of the device tree: an alarm attached to "Ground Floor"
+covers every room and device below it. FanoutTree keeps, for every node, the tuple of alarms
+attached at that node or any ancestor, so finding the alarms to fire for an alert's location is a
+single dictionary lookup instead of a find_node search plus an ancestor walk.
+
+The map is kept up to date incrementally. Adding a node copies its parent's entry. Attaching or
+detaching an alarm, or moving a node, recomputes only the affected subtree. Removing a node drops
+the entries of its subtree. Nodes are also indexed by name, so tree edits no longer search from the
+root either; this assumes node names are unique, which find_node already relies on.
+"""
+
+import random
+import time
+
+from test import Alarm
+from topic6 import Tree, TreeNode
+
+
+class FanoutTree(Tree):
+    def __init__(self, root_data, verbose=True):
+        super().__init__(root_data, verbose)
+        self.nodes = {root_data: self.root}  # Name -> TreeNode
+        self.parents = {root_data: None}  # Name -> parent TreeNode
+        self.attached = {}  # Name -> alarms attached directly at that node
+        self.fanout = {root_data: ()}  # Name -> alarms attached at that node or above
+
+    def find_node(self, data):
+        return self.nodes.get(data)
+
+    def alarms_for(self, location):
+        """Alarms covering a location, or () if the location is not in the tree."""
+        return self.fanout.get(location, ())
+
+    def fire_alarms(self, location):
+        alarms = self.fanout.get(location, ())
+        for alarm in alarms:
+            alarm.turn_on()
+        return alarms
+
+    def _refresh(self, node):
+        """Recompute the fanout entries of node and its whole subtree."""
+        parent = self.parents[node.data]
+        inherited = self.fanout[parent.data] if parent else ()
+        stack = [(node, inherited)]
+        while stack:
+            current, inherited = stack.pop()
+            own = self.attached.get(current.data)
+            entry = inherited + tuple(own) if own else inherited
+            self.fanout[current.data] = entry
+            for child in current.children:
+                stack.append((child, entry))
+
+    def attach_alarm(self, node_data, alarm):
+        node = self.nodes.get(node_data)
+        if not node:
+            if self.verbose:
+                print(f"[Tree] Node '{node_data}' not found.")
+            return False
+        alarms = self.attached.setdefault(node_data, [])
+        if any(existing.alarm_id == alarm.alarm_id for existing in alarms):
+            if self.verbose:
+                print(f"[Tree] Alarm '{alarm.alarm_id}' is already attached to '{node_data}'.")
+            return False
+        alarms.append(alarm)
+        self._refresh(node)
+        if self.verbose:
+            print(f"[Tree] Attached alarm '{alarm.alarm_id}' to '{node_data}'.")
+        return True
+
+    def detach_alarm(self, node_data, alarm_id):
+        alarms = self.attached.get(node_data, [])
+        for alarm in alarms:
+            if alarm.alarm_id == alarm_id:
+                alarms.remove(alarm)
+                if not alarms:
+                    del self.attached[node_data]
+                self._refresh(self.nodes[node_data])
+                if self.verbose:
+                    print(f"[Tree] Detached alarm '{alarm_id}' from '{node_data}'.")
+                return True
+        if self.verbose:
+            print(f"[Tree] Alarm '{alarm_id}' is not attached to '{node_data}'.")
+        return False
+
+    def add_node(self, parent_data, child_data):
+        parent_node = self.nodes.get(parent_data)
+        if not parent_node:
+            if self.verbose:
+                print(f"[Tree] Parent '{parent_data}' not found.")
+            return False
+        if child_data in self.nodes:
+            if self.verbose:
+                print(f"[Tree] Node '{child_data}' already exists in the tree.")
+            return False
+        child_node = TreeNode(child_data, self.verbose)
+        parent_node.add_child(child_node)
+        self.nodes[child_data] = child_node
+        self.parents[child_data] = parent_node
+        self.fanout[child_data] = self.fanout[parent_data]
+        return True
+
+    def remove_node(self, parent_data, child_data):
+        parent_node = self.nodes.get(parent_data)
+        if not parent_node:
+            if self.verbose:
+                print(f"[Tree] Parent '{parent_data}' not found.")
+            return False
+        child_node = self.nodes.get(child_data)
+        if not parent_node.remove_child(child_data):
+            return False
+        stack = [child_node]
+        while stack:
+            current = stack.pop()
+            for table in (self.nodes, self.parents, self.attached, self.fanout):
+                table.pop(current.data, None)
+            stack.extend(current.children)
+        return True
+
+    def move_node(self, child_data, current_parent_data, new_parent_data):
+        current_parent = self.nodes.get(current_parent_data)
+        new_parent = self.nodes.get(new_parent_data)
+        if not current_parent or not new_parent:
+            if not current_parent:
+                if self.verbose:
+                    print(f"[Tree] Current parent '{current_parent_data}' not found.")
+            if not new_parent:
+                if self.verbose:
+                    print(f"[Tree] New parent '{new_parent_data}' not found.")
+            return False
+        ancestor = new_parent
+        while ancestor:
+            if ancestor.data == child_data:
+                if self.verbose:
+                    print(f"[Tree] Cannot move '{child_data}' under its own subtree.")
+                return False
+            ancestor = self.parents[ancestor.data]
+        if not current_parent.move_child(child_data, new_parent):
+            return False
+        self.parents[child_data] = new_parent
+        self._refresh(self.nodes[child_data])
+        return True
+
+
+def alarms_by_search(tree, attached, location):
+    """Reference lookup: find the path from the root by search, then collect alarms along it."""
+    path = []
+
+    def search(node):
+        path.append(node)
+        if node.data == location:
+            return True
+        for child in node.children:
+            if search(child):
+                return True
+        path.pop()
+        return False
+
+    if not search(tree.root):
+        return ()
+    alarms = ()
+    for node in path:
+        alarms += tuple(attached.get(node.data, ()))
+    return alarms
+
+
+def build_house(floors=10, rooms=20, devices=50):
+    tree = FanoutTree("HomeSecuritySystem", verbose=False)
+    tree.attach_alarm("HomeSecuritySystem", Alarm("AL-main", "sirene"))
+    for floor in range(floors):
+        floor_name = f"Floor {floor}"
+        tree.add_node("HomeSecuritySystem", floor_name)
+        tree.attach_alarm(floor_name, Alarm(f"AL-{floor}", "sirene"))
+        for room in range(rooms):
+            room_name = f"Room {floor}-{room}"
+            tree.add_node(floor_name, room_name)
+            if room % 4 == 0:
+                tree.attach_alarm(room_name, Alarm(f"AL-{floor}-{room}", "light"))
+            for device in range(devices):
+                tree.add_node(room_name, f"Sensor {floor}-{room}-{device}")
+    return tree
+
+
+def main(lookups=2_000):
+    print("=== Location-to-Alarm Fan-out ===")
+    start = time.perf_counter()
+    tree = build_house()
+    print(f"Build tree with {len(tree.nodes):,} nodes: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rng = random.Random(4)
+    devices = [name for name in tree.nodes if name.startswith("Sensor")]
+    locations = [rng.choice(devices) for _ in range(lookups)]
+
+    start = time.perf_counter()
+    searched = [alarms_by_search(tree, tree.attached, location) for location in locations]
+    search_us = (time.perf_counter() - start) / lookups * 1e6
+    start = time.perf_counter()
+    fanned = [tree.alarms_for(location) for location in locations]
+    fanout_us = (time.perf_counter() - start) / lookups * 1e6
+    print(f"Alarms per alert: search + ancestor walk {search_us:,.1f} us, fan-out map {fanout_us:.2f} us"
+          f"{'' if searched == fanned else ' [MISMATCH]'}")
+
+    start = time.perf_counter()
+    tree.move_node("Room 3-4", "Floor 3", "Floor 7")
+    move_ms = (time.perf_counter() - start) * 1000
+    print(f"Move a room to another floor: {move_ms:.2f} ms; "
+          f"'Sensor 3-4-0' is now covered by {[alarm.alarm_id for alarm in tree.alarms_for('Sensor 3-4-0')]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# rolling_event_log.py
+
+"""
+Rolling Event Log: A Topic 2 event log that compresses old events and enforces retention.
+
+RollingEventLog keeps the newest events as ordinary SinglyLinkedList nodes (the hot tail). Once
+the hot part holds hot_size + chunk_size events, the oldest chunk_size events are sealed: their
+text is joined and zlib-compressed into a single bytes object. Every chunk is compressed on its
+own, so chunks can be dropped or read independently, but all of them share one preset dictionary
+taken from the first sealed chunk, which lets even small chunks compress well.
+
+Retention drops whole sealed chunks, oldest first: while dropping one still leaves max_events,
+while a chunk's newest event is older than max_age seconds, or while the sealed chunks take more
+than max_bytes. Hot events are never dropped, so limits are met to within one chunk.
+Iterating the log decompresses one sealed chunk at a time, then walks the hot nodes.
+Sealed events are stored as text, so non-string events come back as str(event). A chunk's
+events are joined with NUL; a chunk whose text itself contains NUL records the byte length of each
+event instead, so such events round-trip unchanged.
+"""
+
+import random
+import time
+import tracemalloc
+import zlib
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+
+from topic2 import SinglyLinkedList
+
+SEPARATOR = "\0"
+DICTIONARY_SIZE = 32 * 1024  # zlib preset dictionaries use at most the last 32 KiB
+
+
+class SealedChunk:
+    __slots__ = ('blob', 'count', 'raw_bytes', 'last_appended', 'lengths')
+
+    def __init__(self, blob, count, raw_bytes, last_appended, lengths=None):
+        self.blob = blob
+        self.count = count
+        self.raw_bytes = raw_bytes
+        self.last_appended = last_appended  # Append time of the newest event in the chunk
+        self.lengths = lengths  # Encoded size of each event, or None when the events are NUL-separated
+
+
+class RollingEventLog(SinglyLinkedList):
+    def __init__(self, hot_size=1024, chunk_size=4096, level=6, max_events=None, max_age=None,
+                 max_bytes=None, clock=time.time, verbose=True):
+        super().__init__(verbose=verbose)
+        self.hot_size = hot_size
+        self.chunk_size = chunk_size
+        self.level = level
+        self.max_events = max_events
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hot_count = 0
+        self.hot_times = deque()  # Append time of each hot event, oldest first
+        self.chunks = deque()
+        self.sealed_count = 0
+        self.sealed_bytes = 0  # Compressed size of all sealed chunks
+        self.dropped_count = 0  # Events removed by retention
+        self.dictionary = None
+
+    def __len__(self):
+        return self.sealed_count + self.hot_count
+
+    def append(self, data):
+        super().append(data)
+        self.hot_count += 1
+        self.hot_times.append(self.clock())
+        if self.hot_count >= self.hot_size + self.chunk_size:
+            self.seal_oldest()
+        self.enforce_retention()
+
+    def seal_oldest(self):
+        """Compress the oldest chunk_size hot events into a sealed chunk."""
+        texts = []
+        node = self.head
+        for _ in range(self.chunk_size):
+            texts.append(str(node.data))
+            node = node.next
+        self.head = node
+        if node is None:
+            self.tail = None
+        self.hot_count -= self.chunk_size
+        for _ in range(self.chunk_size - 1):
+            self.hot_times.popleft()
+        last_appended = self.hot_times.popleft()
+
+        joined = SEPARATOR.join(texts)
+        lengths = None
+        if joined.count(SEPARATOR) != len(texts) - 1:
+            encoded = [text.encode('utf-8') for text in texts]
+            lengths = array('I', map(len, encoded))
+            raw = b"".join(encoded)
+        else:
+            raw = joined.encode('utf-8')
+        if self.dictionary is None:
+            self.dictionary = raw[-DICTIONARY_SIZE:]
+        compressor = zlib.compressobj(self.level, zdict=self.dictionary)
+        blob = compressor.compress(raw) + compressor.flush()
+        self.chunks.append(SealedChunk(blob, len(texts), len(raw), last_appended, lengths))
+        self.sealed_count += len(texts)
+        self.sealed_bytes += len(blob)
+
+    def enforce_retention(self):
+        now = self.clock()
+        chunks = self.chunks
+        while chunks:
+            oldest = chunks[0]
+            over_count = self.max_events is not None and len(self) - oldest.count >= self.max_events
+            too_old = self.max_age is not None and now - oldest.last_appended > self.max_age
+            over_bytes = self.max_bytes is not None and self.sealed_bytes > self.max_bytes
+            if not (over_count or too_old or over_bytes):
+                break
+            chunks.popleft()
+            self.sealed_count -= oldest.count
+            self.sealed_bytes -= len(oldest.blob)
+            self.dropped_count += oldest.count
+
+    def read_chunk(self, chunk):
+        decompressor = zlib.decompressobj(zdict=self.dictionary)
+        raw = decompressor.decompress(chunk.blob) + decompressor.flush()
+        if chunk.lengths is None:
+            return raw.decode('utf-8').split(SEPARATOR)
+        texts = []
+        offset = 0
+        for length in chunk.lengths:
+            texts.append(raw[offset:offset + length].decode('utf-8'))
+            offset += length
+        return texts
+
+    def __iter__(self):
+        """Yield every retained event, oldest first, decompressing sealed chunks lazily."""
+        for chunk in list(self.chunks):
+            yield from self.read_chunk(chunk)
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def display(self):
+        elems = [str(event) for event in self]
+        print("Event Logs:", " -> ".join(elems) if elems else "No events recorded.")
+
+    def stats(self):
+        raw = sum(chunk.raw_bytes for chunk in self.chunks)
+        return {
+            'hot_events': self.hot_count,
+            'sealed_events': self.sealed_count,
+            'sealed_chunks': len(self.chunks),
+            'dropped_events': self.dropped_count,
+            'sealed_raw_bytes': raw,
+            'sealed_compressed_bytes': self.sealed_bytes,
+            'compression_ratio': raw / self.sealed_bytes if self.sealed_bytes else 0.0,
+        }
+
+
+def synthetic_events(days, events_per_day, seed=5):
+    rng = random.Random(seed)
+    rooms = ['Living Room', 'Kitchen', 'Front Door', 'Back Door', 'Garage', 'Bedroom 1', 'Bedroom 2']
+    causes = ['motion', 'door opened', 'window opened', 'intrusion', 'temperature anomaly']
+    start = datetime(2025, 1, 1)
+    step = 86_400 / events_per_day
+    for i in range(days * events_per_day):
+        when = start + timedelta(seconds=i * step)
+        yield when.timestamp(), (f"{when:%Y-%m-%d %H:%M:%S} Sensor S{rng.randrange(300)} "
+                                 f"triggered by {rng.choice(causes)} in {rng.choice(rooms)}")
+
+
+def measure(event_log, events):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _, event in events:
+        event_log.append(event)
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used, elapsed
+
+
+def main(days=30, events_per_day=20_000):
+    print(f"=== Rolling Event Log ({days} days x {events_per_day:,} events) ===")
+    events = list(synthetic_events(days, events_per_day))
+    now = [0.0]  # Simulated clock, advanced to each event's time as it is appended
+
+    def replay():
+        for when, event in events:
+            now[0] = when
+            yield when, event
+
+    plain_bytes, plain_time = measure(SinglyLinkedList(verbose=False), events)
+    print(f"Plain SinglyLinkedList:  {plain_bytes / 2**20:8.1f} MiB  ({plain_time:.2f} s to append)")
+
+    rolling = RollingEventLog(verbose=False, clock=lambda: now[0])
+    rolling_bytes, rolling_time = measure(rolling, replay())
+    stats = rolling.stats()
+    print(f"RollingEventLog:         {rolling_bytes / 2**20:8.1f} MiB  ({rolling_time:.2f} s to append, "
+          f"{stats['sealed_chunks']} chunks, {stats['compression_ratio']:.1f}x compression)")
+    print(f"Memory reduction:        {plain_bytes / rolling_bytes:8.1f}x")
+
+    start = time.perf_counter()
+    count = sum(1 for _ in rolling)
+    print(f"Full iteration:          {count:,} events in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    retained = RollingEventLog(verbose=False, max_age=7 * 86_400, clock=lambda: now[0])
+    measure(retained, replay())
+    print(f"With 7-day retention:    {len(retained):,} events kept, {retained.dropped_count:,} dropped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# sensor_registry.py
+
+"""
+Sensor Registry: Index the Topic 1 sensors by location and type for bulk state changes.
+
+Each sensor gets a position in the registry. For every location and every sensor type the
+registry keeps a bitmask of the positions it covers, and the active/inactive status of all
+sensors is a single bitset. "Arm every window sensor on Floor 1" is then one AND and one OR
+on Python integers, and status counts are a popcount, instead of a loop over Sensor objects.
+"""
+
+import random
+import time
+
+from test import Sensor
+
+
+class SensorRegistry:
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self.ids = []  # Position -> sensor ID
+        self.types = []  # Position -> sensor type
+        self.locations = []  # Position -> location
+        self.positions = {}  # Sensor ID -> position
+        self.status = 0  # Bit i is set when the sensor at position i is active
+        # Membership bits per location/type, kept as bytearrays so adding a sensor is O(1).
+        # The integer masks used by the bulk operations are rebuilt lazily when stale.
+        self.location_bits = {}
+        self.type_bits = {}
+        self.mask_cache = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_sensors(cls, sensors, verbose=True):
+        """Build a registry from the sensors dict used in test.py, keeping each sensor's status."""
+        registry = cls(verbose=verbose)
+        active = []
+        for sensor in sensors.values():
+            registry.add_sensor(sensor.sensor_id, sensor.sensor_type, sensor.location)
+            if sensor.status == 'active':
+                active.append(registry.positions[sensor.sensor_id])
+        registry.status = registry._mask_from_positions(active)
+        return registry
+
+    def add_sensor(self, sensor_id, sensor_type, location):
+        if sensor_id in self.positions:
+            if self.verbose:
+                print(f"[Registry] Sensor '{sensor_id}' already exists.")
+            return False
+        position = len(self.ids)
+        self.ids.append(sensor_id)
+        self.types.append(sensor_type)
+        self.locations.append(location)
+        self.positions[sensor_id] = position
+        self._set_member(self.location_bits, ('location', location), position)
+        self._set_member(self.type_bits, ('type', sensor_type), position)
+        return True
+
+    def _set_member(self, bits_by_key, key, position):
+        bits = bits_by_key.get(key)
+        if bits is None:
+            bits = bits_by_key[key] = bytearray()
+        byte_index = position >> 3
+        if byte_index >= len(bits):
+            bits.extend(bytes(byte_index - len(bits) + 1))
+        bits[byte_index] |= 1 << (position & 7)
+        self.mask_cache.pop(key, None)
+
+    def _mask_from_positions(self, positions):
+        bits = bytearray((len(self.ids) + 7) >> 3)
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bits, 'little')
+
+    def _mask(self, bits_by_key, key):
+        mask = self.mask_cache.get(key)
+        if mask is None:
+            bits = bits_by_key.get(key)
+            mask = int.from_bytes(bits, 'little') if bits else 0
+            self.mask_cache[key] = mask
+        return mask
+
+    def select(self, location=None, sensor_type=None):
+        """Bitmask of the sensors matching location and/or type (all sensors if both are None)."""
+        mask = (1 << len(self.ids)) - 1
+        if location is not None:
+            mask &= self._mask(self.location_bits, ('location', location))
+        if sensor_type is not None:
+            mask &= self._mask(self.type_bits, ('type', sensor_type))
+        return mask
+
+    def activate(self, location=None, sensor_type=None):
+        """Activate every matching sensor. Returns how many changed state."""
+        mask = self.select(location, sensor_type)
+        changed = (mask & ~self.status).bit_count()
+        self.status |= mask
+        if self.verbose:
+            print(f"[Registry] Activated {changed} sensor(s).")
+        return changed
+
+    def deactivate(self, location=None, sensor_type=None):
+        """Deactivate every matching sensor. Returns how many changed state."""
+        mask = self.select(location, sensor_type)
+        changed = (mask & self.status).bit_count()
+        self.status &= ~mask
+        if self.verbose:
+            print(f"[Registry] Deactivated {changed} sensor(s).")
+        return changed
+
+    def activate_sensor(self, sensor_id):
+        position = self.positions.get(sensor_id)
+        if position is None:
+            if self.verbose:
+                print(f"[Registry] Sensor '{sensor_id}' not found.")
+            return False
+        self.status |= 1 << position
+        return True
+
+    def deactivate_sensor(self, sensor_id):
+        position = self.positions.get(sensor_id)
+        if position is None:
+            if self.verbose:
+                print(f"[Registry] Sensor '{sensor_id}' not found.")
+            return False
+        self.status &= ~(1 << position)
+        return True
+
+    def get_status(self, sensor_id):
+        position = self.positions.get(sensor_id)
+        if position is None:
+            return None
+        return 'active' if self.status >> position & 1 else 'inactive'
+
+    def count(self, status='active', location=None, sensor_type=None):
+        mask = self.select(location, sensor_type)
+        if status == 'active':
+            return (mask & self.status).bit_count()
+        return (mask & ~self.status).bit_count()
+
+    def sensor_ids(self, status='active', location=None, sensor_type=None):
+        """Yield the IDs of matching sensors, skipping empty bytes of the mask."""
+        mask = self.select(location, sensor_type)
+        mask = mask & self.status if status == 'active' else mask & ~self.status
+        for byte_index, byte in enumerate(mask.to_bytes((len(self.ids) + 7) >> 3, 'little')):
+            while byte:
+                low_bit = byte & -byte
+                yield self.ids[(byte_index << 3) + low_bit.bit_length() - 1]
+                byte ^= low_bit
+
+    def get_sensor(self, sensor_id):
+        """Return a test.py Sensor object for the given ID, with its current status."""
+        position = self.positions.get(sensor_id)
+        if position is None:
+            return None
+        sensor = Sensor(sensor_id, self.types[position], self.locations[position])
+        sensor.status = self.get_status(sensor_id)
+        return sensor
+
+
+def main():
+    sensor_count = 1_000_000
+    sensor_types = ['motion', 'door', 'window']
+    locations = [f"Floor {floor}" for floor in range(1, 21)]
+    rng = random.Random(42)
+
+    print(f"=== Sensor Registry Benchmark ({sensor_count:,} sensors) ===")
+    registry = SensorRegistry(verbose=False)
+    start = time.perf_counter()
+    for i in range(sensor_count):
+        registry.add_sensor(f"S{i}", rng.choice(sensor_types), rng.choice(locations))
+    print(f"Register sensors:              {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    start = time.perf_counter()
+    registry.select('Floor 1', 'window')
+    print(f"Build masks (first query):     {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+    for label, operation in (
+            ("Arm windows on Floor 1", lambda: registry.activate('Floor 1', 'window')),
+            ("Activate all motion sensors", lambda: registry.activate(sensor_type='motion')),
+            ("Count active on Floor 1", lambda: registry.count('active', location='Floor 1')),
+            ("Count active overall", lambda: registry.count('active')),
+            ("Deactivate everything", lambda: registry.deactivate())):
+        start = time.perf_counter()
+        result = operation()
+        print(f"{label + ':':<31}{(time.perf_counter() - start) * 1000:9.2f} ms  (result {result:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ This module provides implementations for SinglyLinkedList (for Event Logs) and D
 which can be used to manage dynamic data like event logs, active user sessions, etc.
 """
 
+from instrumentation import stats_menu
+
 class SinglyNode:
     def __init__(self, data):
         self.data = data  # Event data
@@ -14,20 +16,23 @@ class SinglyNode:
 
 
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.head = None
+        self.tail = None  # Last node, so appending does not walk the whole log
+        self.verbose = verbose  # Set to False to silence the per-operation messages
 
     def append(self, data):
         new_node = SinglyNode(data)
         if not self.head:
             self.head = new_node
-            print(f"[Event Log] Appended '{data}' as head.")
+            self.tail = new_node
+            if self.verbose:
+                print(f"[Event Log] Appended '{data}' as head.")
             return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
-        print(f"[Event Log] Appended '{data}' to the event log.")
+        self.tail.next = new_node
+        self.tail = new_node
+        if self.verbose:
+            print(f"[Event Log] Appended '{data}' to the event log.")
 
     def display(self):
         elems = []
@@ -46,21 +51,24 @@ class DoublyNode:
 
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.head = None
+        self.verbose = verbose  # Set to False to silence the per-operation messages
 
     def append(self, data):
         new_node = DoublyNode(data)
         if not self.head:
             self.head = new_node
-            print(f"[Active Sessions] Added '{data}' as first session.")
+            if self.verbose:
+                print(f"[Active Sessions] Added '{data}' as first session.")
             return
         current = self.head
         while current.next:
             current = current.next
         current.next = new_node
         new_node.prev = current
-        print(f"[Active Sessions] Added '{data}' to active sessions.")
+        if self.verbose:
+            print(f"[Active Sessions] Added '{data}' to active sessions.")
 
     def remove(self, data):
         current = self.head
@@ -72,10 +80,12 @@ class DoublyLinkedList:
                     self.head = current.next
                 if current.next:
                     current.next.prev = current.prev
-                print(f"[Active Sessions] Removed session '{data}'.")
+                if self.verbose:
+                    print(f"[Active Sessions] Removed session '{data}'.")
                 return True
             current = current.next
-        print(f"[Active Sessions] Session '{data}' not found.")
+        if self.verbose:
+            print(f"[Active Sessions] Session '{data}' not found.")
         return False
 
     def display(self):
@@ -95,6 +105,7 @@ def main():
         print("\n=== Linked Lists Management for Home Security System ===")
         print("1. Manage Event Logs (Singly Linked List)")
         print("2. Manage Active Sessions (Doubly Linked List)")
+        print("S. Operation Stats")
         print("3. Exit")
         choice = input("Select an option: ")
 
@@ -105,6 +116,8 @@ def main():
         elif choice == '3':
             print("Exiting System.")
             break
+        elif choice.strip().lower() == 's':
+            stats_menu()
         else:
             print("Invalid choice. Please try again.")
 
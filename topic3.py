@@ -7,6 +7,8 @@ This module provides an implementation of CircularLinkedList,
 which can be used for cyclic processing tasks like rotating through active sensors for periodic checks.
 """
 
+from instrumentation import stats_menu
+
 class CircularNode:
     def __init__(self, data):
         self.data = data  # Sensor ID or Sensor object
@@ -14,22 +16,59 @@ class CircularNode:
 
 
 class CircularLinkedList:
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.head = None
+        self.verbose = verbose  # Set to False to silence the per-operation messages
 
     def append(self, data):
         new_node = CircularNode(data)
         if not self.head:
             self.head = new_node
             new_node.next = self.head
-            print(f"[Sensor Rotation] Appended '{data}' as head.")
+            if self.verbose:
+                print(f"[Sensor Rotation] Appended '{data}' as head.")
             return
         current = self.head
         while current.next != self.head:
             current = current.next
         current.next = new_node
         new_node.next = self.head
-        print(f"[Sensor Rotation] Appended '{data}' to the rotation list.")
+        if self.verbose:
+            print(f"[Sensor Rotation] Appended '{data}' to the rotation list.")
+
+    def remove(self, data):
+        if not self.head:
+            if self.verbose:
+                print("[Error] Rotation list is empty.")
+            return False
+
+        current = self.head
+        prev = None
+        while True:
+            if current.data == data:
+                if prev:
+                    prev.next = current.next
+                else:
+                    # Removing head
+                    if current.next == self.head:
+                        self.head = None
+                    else:
+                        self.head = current.next
+                        # Find last node to point to new head
+                        last = self.head
+                        while last.next != current:
+                            last = last.next
+                        last.next = self.head
+                if self.verbose:
+                    print(f"[Sensor Rotation] Removed '{data}' from rotation list.")
+                return True
+            prev = current
+            current = current.next
+            if current == self.head:
+                break
+        if self.verbose:
+            print(f"[Error] Sensor '{data}' not found in rotation list.")
+        return False
 
     def display(self):
         if not self.head:
@@ -65,6 +104,7 @@ def main():
         print("2. Display Rotation List")
         print("3. Traverse Rotation List")
         print("4. Remove Sensor from Rotation")
+        print("S. Operation Stats")
         print("5. Exit")
         choice = input("Select an option: ")
 
@@ -84,6 +124,8 @@ def main():
         elif choice == '5':
             print("Exiting System.")
             break
+        elif choice.strip().lower() == 's':
+            stats_menu()
         else:
             print("Invalid choice. Please try again.")
 
@@ -91,34 +133,7 @@ def main():
 def remove_sensor(rotation_list):
     print("\n--- Remove Sensor from Rotation ---")
     sensor_id = input("Enter Sensor ID to remove: ")
-    if not rotation_list.head:
-        print("[Error] Rotation list is empty.")
-        return
-
-    current = rotation_list.head
-    prev = None
-    while True:
-        if current.data == sensor_id:
-            if prev:
-                prev.next = current.next
-            else:
-                # Removing head
-                if current.next == rotation_list.head:
-                    rotation_list.head = None
-                else:
-                    rotation_list.head = current.next
-                    # Find last node to point to new head
-                    last = rotation_list.head
-                    while last.next != current:
-                        last = last.next
-                    last.next = rotation_list.head
-            print(f"[Sensor Rotation] Removed '{sensor_id}' from rotation list.")
-            return
-        prev = current
-        current = current.next
-        if current == rotation_list.head:
-            break
-    print(f"[Error] Sensor '{sensor_id}' not found in rotation list.")
+    rotation_list.remove(sensor_id)
 
 
 if __name__ == "__main__":
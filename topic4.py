@@ -6,66 +6,169 @@ Topic 4: Create Deque to manage a fixed number of security commands in the home
 This module provides an implementation of a Deque,
 which is used to manage security commands or maintenance tasks with a fixed size.
 When the deque reaches its maximum size, adding a new command will prompt the user to confirm the removal of an existing command.
+In coalescing mode, repeated commands (e.g. 'Lock all doors' five times) and superseding commands
+(e.g. 'Arm Zone 1' followed by 'Disarm Zone 1') are merged so only the effective command keeps a slot.
+A command added to the front that merges into a queued one also moves that entry to the front
+(O(n) in the queued commands, unlike the O(1) adds and removes at either end).
 """
 
 from collections import deque
+from instrumentation import stats_menu
+
+def parse_command(command):
+    """Split a security command into (action, target), e.g. 'Arm Zone 1' -> ('arm', 'Zone 1')."""
+    parts = command.strip().split(maxsplit=1)
+    if not parts:
+        return '', ''
+    action = parts[0].lower()
+    target = parts[1] if len(parts) > 1 else ''
+    return action, target
+
+# Actions that cancel each other out when they target the same zone or device
+OPPOSING_ACTIONS = {
+    'arm': 'arm/disarm', 'disarm': 'arm/disarm',
+    'lock': 'lock/unlock', 'unlock': 'lock/unlock',
+    'activate': 'activate/deactivate', 'deactivate': 'activate/deactivate',
+    'enable': 'enable/disable', 'disable': 'enable/disable',
+    'open': 'open/close', 'close': 'open/close',
+}
+
+def command_target(command):
+    """Device or zone a command addresses, lower-cased and without any ' to <value>' setting.
+
+    'Lock Front Door' and 'unlock front door' -> 'front door'; 'Set Thermostat to 22' -> 'thermostat'.
+    """
+    target = parse_command(command)[1].lower()
+    return target.split(' to ', 1)[0].strip()
+
+def command_key(command):
+    """Key shared by duplicate and superseding commands, e.g. 'Arm Zone 1' and 'Disarm Zone 1',
+    or 'Set Thermostat to 22' and 'Set Thermostat to 24'."""
+    action = parse_command(command)[0]
+    return OPPOSING_ACTIONS.get(action, action), command_target(command)
 
 class FixedDeque:
-    def __init__(self, max_size):
+    def __init__(self, max_size, verbose=True, coalesce=False):
         self.deque = deque()
         self.max_size = max_size
+        self.verbose = verbose  # Set to False to silence the per-operation messages
+        # In coalescing mode the deque holds command keys and pending maps each key to the
+        # effective command, so a duplicate or superseding command never takes a new slot.
+        self.coalesce = coalesce
+        self.pending = {}
+        self.coalesced = 0  # Commands merged into an already queued command
+
+    def command_at(self, entry):
+        return self.pending[entry] if self.coalesce else entry
+
+    def commands(self):
+        return [self.command_at(entry) for entry in self.deque]
 
     def is_full(self):
         return len(self.deque) >= self.max_size
 
+    def would_coalesce(self, item):
+        """True if adding item would merge into a queued command instead of taking a slot."""
+        return self.coalesce and command_key(item) in self.pending
+
     def get_rear_item(self):
-        return self.deque[-1] if self.deque else None
+        return self.command_at(self.deque[-1]) if self.deque else None
 
     def get_front_item(self):
-        return self.deque[0] if self.deque else None
+        return self.command_at(self.deque[0]) if self.deque else None
+
+    def merge_command(self, item):
+        """Coalescing mode: index item by key. Returns the new deque entry, or None if merged."""
+        key = command_key(item)
+        queued = self.pending.get(key)
+        self.pending[key] = item
+        if queued is None:
+            return key
+        self.coalesced += 1
+        if self.verbose:
+            if queued == item:
+                print(f"[Deque] Command '{item}' is already queued. Duplicate dropped.")
+            else:
+                print(f"[Deque] Command '{item}' replaced queued command '{queued}'.")
+        return None
 
     def add_front(self, item):
-        self.deque.appendleft(item)
-        print(f"[Deque] Added '{item}' to the front.")
+        entry = self.merge_command(item) if self.coalesce else item
+        if entry is None:
+            # Merged into a queued command: still honour "do this next" by moving it to the front.
+            # deque.remove() is O(n) in the queued commands, which max_size keeps small.
+            key = command_key(item)
+            if self.deque[0] != key:
+                self.deque.remove(key)
+                self.deque.appendleft(key)
+                if self.verbose:
+                    print(f"[Deque] Moved '{item}' to the front.")
+            return False
+        self.deque.appendleft(entry)
+        if self.verbose:
+            print(f"[Deque] Added '{item}' to the front.")
+        return True
 
     def add_rear(self, item):
-        self.deque.append(item)
-        print(f"[Deque] Added '{item}' to the rear.")
+        entry = self.merge_command(item) if self.coalesce else item
+        if entry is None:
+            return False
+        self.deque.append(entry)
+        if self.verbose:
+            print(f"[Deque] Added '{item}' to the rear.")
+        return True
 
     def remove_front(self):
         if self.deque:
-            item = self.deque.popleft()
-            print(f"[Deque] Removed '{item}' from the front.")
+            entry = self.deque.popleft()
+            item = self.pending.pop(entry) if self.coalesce else entry
+            if self.verbose:
+                print(f"[Deque] Removed '{item}' from the front.")
             return item
-        print("[Deque] Deque is empty. Cannot remove from front.")
+        if self.verbose:
+            print("[Deque] Deque is empty. Cannot remove from front.")
         return None
 
     def remove_rear(self):
         if self.deque:
-            item = self.deque.pop()
-            print(f"[Deque] Removed '{item}' from the rear.")
+            entry = self.deque.pop()
+            item = self.pending.pop(entry) if self.coalesce else entry
+            if self.verbose:
+                print(f"[Deque] Removed '{item}' from the rear.")
             return item
-        print("[Deque] Deque is empty. Cannot remove from rear.")
+        if self.verbose:
+            print("[Deque] Deque is empty. Cannot remove from rear.")
         return None
 
     def search_command(self, item):
-        if item in self.deque:
-            position = list(self.deque).index(item) + 1
-            print(f"[Deque] Command '{item}' found at position {position} from the front.")
+        if self.coalesce:
+            key = command_key(item)
+            found = self.pending.get(key) == item
+            entry = key
+        else:
+            found = item in self.deque
+            entry = item
+        if found:
+            if self.verbose:
+                position = list(self.deque).index(entry) + 1
+                print(f"[Deque] Command '{item}' found at position {position} from the front.")
             return True
-        print(f"[Deque] Command '{item}' not found in the deque.")
+        if self.verbose:
+            print(f"[Deque] Command '{item}' not found in the deque.")
         return False
 
     def clear_deque(self):
         self.deque.clear()
-        print("[Deque] All commands have been cleared from the deque.")
+        self.pending.clear()
+        if self.verbose:
+            print("[Deque] All commands have been cleared from the deque.")
 
     def display(self):
         if not self.deque:
             print("Current Deque: [Empty]")
         else:
             print("Current Deque:")
-            for idx, cmd in enumerate(self.deque, start=1):
+            for idx, cmd in enumerate(self.commands(), start=1):
                 print(f"  {idx}. {cmd}")
 
 def main():
@@ -78,7 +181,8 @@ def main():
         else:
             print("[Error] Please enter a valid positive integer.")
 
-    fixed_deque = FixedDeque(max_size)
+    coalesce = input("Merge duplicate and superseding commands? (yes/no): ").strip().lower() == 'yes'
+    fixed_deque = FixedDeque(max_size, coalesce=coalesce)
 
     while True:
         print("\n--- Deque Operations ---")
@@ -89,8 +193,9 @@ def main():
         print("5. Search for a Security Command")
         print("6. Clear All Security Commands")
         print("7. Display Deque")
+        print("S. Operation Stats")
         print("8. Exit")
-        choice = input("Select an option (1-8): ").strip()
+        choice = input("Select an option (1-8 or S): ").strip()
 
         if choice == '1':
             command = input("Enter security command to add to front (e.g., 'Lock all doors'): ").strip()
@@ -98,7 +203,7 @@ def main():
                 print("[Error] Command cannot be empty.")
                 continue
 
-            if fixed_deque.is_full():
+            if fixed_deque.is_full() and not fixed_deque.would_coalesce(command):
                 removed_item = fixed_deque.get_rear_item()
                 print(f"[Warning] Adding this command will exceed the maximum size of {fixed_deque.max_size}.")
                 print(f"       '{removed_item}' will be removed to accommodate the new command.")
@@ -117,7 +222,7 @@ def main():
                 print("[Error] Command cannot be empty.")
                 continue
 
-            if fixed_deque.is_full():
+            if fixed_deque.is_full() and not fixed_deque.would_coalesce(command):
                 removed_item = fixed_deque.get_front_item()
                 print(f"[Warning] Adding this command will exceed the maximum size of {fixed_deque.max_size}.")
                 print(f"       '{removed_item}' will be removed to accommodate the new command.")
@@ -160,8 +265,11 @@ def main():
             print("Exiting Topic 4.")
             break
 
+        elif choice.strip().lower() == 's':
+            stats_menu()
+
         else:
-            print("[Error] Invalid choice. Please select a number between 1 and 8.")
+            print("[Error] Invalid choice. Please select a number between 1 and 8, or S.")
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,7 @@ Each alert is timestamped automatically with the current system time upon creati
 """
 
 from datetime import datetime
+from instrumentation import stats_menu
 
 class DoublyNode:
     def __init__(self, data):
@@ -16,41 +17,54 @@ class DoublyNode:
         self.next = None
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.head = None
+        self.tail = None  # Last node, so adding an alert does not walk the whole list
+        self.verbose = verbose  # Set to False to silence the per-operation messages
 
     def add_alert(self, alert):
         new_node = DoublyNode(alert)
         if not self.head:
             self.head = new_node
-            print(f"[Active Alerts] Added '{alert.alert_id}' as the first active alert.")
+            self.tail = new_node
+            if self.verbose:
+                print(f"[Active Alerts] Added '{alert.alert_id}' as the first active alert.")
             return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
-        new_node.prev = current
-        print(f"[Active Alerts] Added '{alert.alert_id}' to active alerts.")
+        self.tail.next = new_node
+        new_node.prev = self.tail
+        self.tail = new_node
+        if self.verbose:
+            print(f"[Active Alerts] Added '{alert.alert_id}' to active alerts.")
+
+    def unlink(self, node):
+        """Detach a node of this list in O(1), for callers that keep their own ID -> node map."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
 
     def remove_alert(self, alert_id):
         current = self.head
         while current:
             if current.data.alert_id == alert_id:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.prev = current.prev
-                print(f"[Active Alerts] Resolved and removed alert '{alert_id}'.")
+                self.unlink(current)
+                if self.verbose:
+                    print(f"[Active Alerts] Resolved and removed alert '{alert_id}'.")
                 return True
             current = current.next
-        print(f"[Active Alerts] Alert '{alert_id}' not found.")
+        if self.verbose:
+            print(f"[Active Alerts] Alert '{alert_id}' not found.")
         return False
 
     def clear_alerts(self):
         self.head = None
-        print("[Active Alerts] All active alerts have been cleared.")
+        self.tail = None
+        if self.verbose:
+            print("[Active Alerts] All active alerts have been cleared.")
 
     def display_alerts(self):
         if not self.head:
@@ -81,6 +95,15 @@ class Alert:
         return (f"Alert(ID:{self.alert_id}, Sensor:{self.sensor_id}, Type:{self.alert_type}, "
                 f"Priority:{self.priority}, Time:{self.timestamp}, Message:{self.message})")
 
+ALERT_TYPES = ['intrusion', 'fire', 'temperature_anomaly']
+
+def parse_priority(priority):
+    """Priority as an int if it is a whole number from 1 to 5, otherwise None."""
+    priority = str(priority).strip()
+    if priority.isdigit() and 1 <= int(priority) <= 5:
+        return int(priority)
+    return None
+
 def main():
     active_alerts = DoublyLinkedList()
     alert_ids = set()  # To ensure unique alert IDs
@@ -91,8 +114,9 @@ def main():
         print("2. Resolve (Remove) Active Alert")
         print("3. Display Active Alerts")
         print("4. Clear All Active Alerts")
+        print("S. Operation Stats")
         print("5. Exit")
-        choice = input("Select an option (1-5): ").strip()
+        choice = input("Select an option (1-5 or S): ").strip()
 
         if choice == '1':
             alert_id = input("Enter Alert ID (unique): ").strip()
@@ -107,13 +131,12 @@ def main():
                 print("[Error] Sensor ID cannot be empty.")
                 continue
             alert_type = input("Enter Alert Type (intrusion/fire/temperature_anomaly): ").lower()
-            if alert_type not in ['intrusion', 'fire', 'temperature_anomaly']:
+            if alert_type not in ALERT_TYPES:
                 print("[Error] Invalid alert type. Please choose from 'intrusion', 'fire', or 'temperature_anomaly'.")
                 continue
             while True:
-                priority = input("Enter Alert Priority (1-5, 1 highest): ").strip()
-                if priority.isdigit() and 1 <= int(priority) <= 5:
-                    priority = int(priority)
+                priority = parse_priority(input("Enter Alert Priority (1-5, 1 highest): "))
+                if priority is not None:
                     break
                 else:
                     print("[Error] Please enter a valid priority between 1 and 5.")
@@ -149,8 +172,10 @@ def main():
         elif choice == '5':
             print("Exiting Topic 5.")
             break
+        elif choice.strip().lower() == 's':
+            stats_menu()
         else:
-            print("[Error] Invalid choice. Please select a number between 1 and 5.")
+            print("[Error] Invalid choice. Please select a number between 1 and 5, or S.")
 
 if __name__ == "__main__":
     main()
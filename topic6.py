@@ -7,22 +7,28 @@ This module provides an implementation of a Tree structure,
 which is used to represent hierarchical data like device groupings (e.g., locations, rooms).
 """
 
+from instrumentation import stats_menu
+
 class TreeNode:
-    def __init__(self, data):
+    def __init__(self, data, verbose=True):
         self.data = data  # Node data (e.g., Location, Room, Device)
         self.children = []
+        self.verbose = verbose  # Set to False to silence the per-operation messages
 
     def add_child(self, child_node):
         self.children.append(child_node)
-        print(f"[Tree] Added child '{child_node.data}' to parent '{self.data}'.")
+        if self.verbose:
+            print(f"[Tree] Added child '{child_node.data}' to parent '{self.data}'.")
 
     def remove_child(self, child_data):
         for child in self.children:
             if child.data == child_data:
                 self.children.remove(child)
-                print(f"[Tree] Removed child '{child_data}' from parent '{self.data}'.")
+                if self.verbose:
+                    print(f"[Tree] Removed child '{child_data}' from parent '{self.data}'.")
                 return True
-        print(f"[Tree] Child '{child_data}' not found under parent '{self.data}'.")
+        if self.verbose:
+            print(f"[Tree] Child '{child_data}' not found under parent '{self.data}'.")
         return False
 
     def find_node(self, data):
@@ -39,9 +45,11 @@ class TreeNode:
             if child.data == child_data:
                 self.children.remove(child)
                 new_parent_node.add_child(child)
-                print(f"[Tree] Moved '{child_data}' from '{self.data}' to '{new_parent_node.data}'.")
+                if self.verbose:
+                    print(f"[Tree] Moved '{child_data}' from '{self.data}' to '{new_parent_node.data}'.")
                 return True
-        print(f"[Tree] Child '{child_data}' not found under parent '{self.data}'.")
+        if self.verbose:
+            print(f"[Tree] Child '{child_data}' not found under parent '{self.data}'.")
         return False
 
     def display(self, level=0):
@@ -50,27 +58,30 @@ class TreeNode:
             child.display(level + 1)
 
 class Tree:
-    def __init__(self, root_data):
-        self.root = TreeNode(root_data)
-        print(f"[Tree] Created tree with root '{root_data}'.")
+    def __init__(self, root_data, verbose=True):
+        self.verbose = verbose  # Set to False to silence the per-operation messages; new nodes inherit it
+        self.root = TreeNode(root_data, verbose)
+        if verbose:
+            print(f"[Tree] Created tree with root '{root_data}'.")
 
     def add_node(self, parent_data, child_data):
         parent_node = self.root.find_node(parent_data)
         if parent_node:
             # Check for duplicate child under the same parent
             if any(child.data == child_data for child in parent_node.children):
-                print(f"[Tree] Child '{child_data}' already exists under parent '{parent_data}'.")
+                if self.verbose:
+                    print(f"[Tree] Child '{child_data}' already exists under parent '{parent_data}'.")
                 return
-            child_node = TreeNode(child_data)
+            child_node = TreeNode(child_data, self.verbose)
             parent_node.add_child(child_node)
-        else:
+        elif self.verbose:
             print(f"[Tree] Parent '{parent_data}' not found.")
 
     def remove_node(self, parent_data, child_data):
         parent_node = self.root.find_node(parent_data)
         if parent_node:
             parent_node.remove_child(child_data)
-        else:
+        elif self.verbose:
             print(f"[Tree] Parent '{parent_data}' not found.")
 
     def move_node(self, child_data, current_parent_data, new_parent_data):
@@ -78,7 +89,7 @@ class Tree:
         new_parent = self.root.find_node(new_parent_data)
         if current_parent and new_parent:
             current_parent.move_child(child_data, new_parent)
-        else:
+        elif self.verbose:
             if not current_parent:
                 print(f"[Tree] Current parent '{current_parent_data}' not found.")
             if not new_parent:
@@ -111,8 +122,9 @@ def main():
         print("4. Move Device/Group to Another Group/Room")
         print("5. Search for a Device/Group")
         print("6. Display Hierarchical Structure")
+        print("S. Operation Stats")
         print("7. Exit")
-        choice = input("Select an option (1-7): ")
+        choice = input("Select an option (1-7 or S): ")
 
         if choice == '1':
             parent = input("Enter parent group/room name (e.g., 'Living Room'): ").strip()
@@ -154,8 +166,10 @@ def main():
         elif choice == '7':
             print("Exiting Topic 6.")
             break
+        elif choice.strip().lower() == 's':
+            stats_menu()
         else:
-            print("[Error] Invalid choice. Please select a number between 1 and 7.")
+            print("[Error] Invalid choice. Please select a number between 1 and 7, or S.")
 
 if __name__ == "__main__":
     main()
@@ -7,6 +7,8 @@ This module provides an implementation of the Quick Sort algorithm
 to sort Active Alerts based on their priority levels.
 """
 
+from instrumentation import stats_menu
+
 def quick_sort(data, low, high, key=lambda x: x):
     if low < high:
         pi = partition(data, low, high, key)
@@ -47,6 +49,7 @@ def main():
         print("1. Add Alert")
         print("2. Sort Alerts by Priority")
         print("3. Display Alerts")
+        print("S. Operation Stats")
         print("4. Exit")
         choice = input("Select an option: ")
 
@@ -81,6 +84,8 @@ def main():
         elif choice == '4':
             print("Exiting Topic 7.")
             break
+        elif choice.strip().lower() == 's':
+            stats_menu()
         else:
             print("Invalid choice. Please try again.")
 